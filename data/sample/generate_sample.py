@@ -10,14 +10,15 @@ sys.path.append(str(Path(__file__).parent.parent.parent))
 from decimal import Decimal
 from src.engine.order_book import LimitOrderBook
 from src.replay.synthetic_generator import PoissonOrderGenerator
-from src.data.loaders import save_snapshots_csv
+from src.data.loaders import save_snapshots_csv, save_snapshots_parquet_columns
 import time
 
 
 def generate_sample_data(
     symbol: str = "DEMO",
     duration_seconds: float = 60.0,
-    output_dir: str = "."
+    output_dir: str = ".",
+    output_format: str = "parquet"
 ):
     """
     Generate sample market data using synthetic generator.
@@ -25,7 +26,9 @@ def generate_sample_data(
     Args:
         symbol: Trading symbol
         duration_seconds: Duration of simulation
-        output_dir: Output directory for CSV files
+        output_dir: Output directory for data files
+        output_format: "parquet" (default, compact columnar) or "csv"
+                       (opt-in, for debugging by eye)
     """
     print(f"Generating {duration_seconds}s of sample data for {symbol}...")
 
@@ -33,20 +36,23 @@ def generate_sample_data(
     book = LimitOrderBook(symbol)
 
     # Create generator
+    arrival_rate = 50.0  # 50 orders/sec
     generator = PoissonOrderGenerator(
         symbol=symbol,
         base_price=Decimal("100.0"),
         volatility=0.01,
-        arrival_rate=50.0  # 50 orders/sec
+        arrival_rate=arrival_rate
     )
 
-    # Collect snapshots
+    # Collect snapshots on an event-count trigger instead of polling
+    # wall-clock per event; this drops a syscall per event and makes
+    # runs deterministic for a given event stream.
     snapshots = []
-    snapshot_interval = 1.0  # 1 second
-    last_snapshot = 0
+    snapshot_interval = 1.0  # 1 second (in simulated event time)
+    snapshot_every_n = max(1, int(arrival_rate * snapshot_interval))
 
-    start_time = time.time()
     events_processed = 0
+    events_since_snapshot = 0
 
     for event in generator.generate_order_stream(duration_seconds):
         if event["type"] == "new":
@@ -58,11 +64,10 @@ def generate_sample_data(
             book.cancel_order(event["order_id"])
 
         # Take periodic snapshots
-        elapsed = time.time() - start_time
-        if elapsed - last_snapshot >= snapshot_interval:
-            snapshot = book.get_snapshot(levels=10)
-            snapshots.append(snapshot)
-            last_snapshot = elapsed
+        events_since_snapshot += 1
+        if events_since_snapshot >= snapshot_every_n:
+            snapshots.append(book.get_snapshot(levels=10))
+            events_since_snapshot = 0
 
     # Final snapshot
     snapshots.append(book.get_snapshot(levels=10))
@@ -72,9 +77,13 @@ def generate_sample_data(
     print(f"Total trades: {book.total_trades}")
     print(f"Final mid price: ${book.mid_price}")
 
-    # Save to CSV
-    output_path = Path(output_dir) / f"{symbol}_snapshots.csv"
-    save_snapshots_csv(snapshots, str(output_path), levels=10)
+    # Save snapshots (Parquet by default; CSV is opt-in for debugging)
+    if output_format == "csv":
+        output_path = Path(output_dir) / f"{symbol}_snapshots.csv"
+        save_snapshots_csv(snapshots, str(output_path), levels=10)
+    else:
+        output_path = Path(output_dir) / f"{symbol}_snapshots.parquet"
+        save_snapshots_parquet_columns(snapshots, str(output_path), levels=10)
     print(f"Saved snapshots to {output_path}")
 
 
@@ -0,0 +1,135 @@
+"""
+Numba-accelerated array-kernel benchmark for the matching engine core.
+
+Runs the synthetic limit-order workload from benchmark_performance over
+SoA int64 tick arrays through an optionally @njit-compiled ladder
+matching kernel. Install the [perf] extra (numba) to get the compiled
+path; without it the same kernel runs as plain Python over NumPy arrays.
+"""
+import sys
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import time
+
+import numpy as np
+
+from src.engine.order import PRICE_SCALE
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator fallback when numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True)
+def match_limit_orders(price_idx, sides, qtys, bid_qty, ask_qty):
+    """
+    Ladder-array limit order matching kernel.
+
+    Prices are dense tick indices into the bid_qty/ask_qty ladders.
+    sides: 0 = buy, 1 = sell. Returns (num_fills, matched_volume).
+    """
+    num_levels = bid_qty.shape[0]
+    best_ask = num_levels  # index of lowest resting ask (num_levels = none)
+    best_bid = -1          # index of highest resting bid (-1 = none)
+
+    fills = 0
+    volume = 0
+
+    for i in range(price_idx.shape[0]):
+        p = price_idx[i]
+        q = qtys[i]
+
+        if sides[i] == 0:  # buy: lift asks priced at or below p
+            while q > 0 and best_ask < num_levels and best_ask <= p:
+                take = min(q, ask_qty[best_ask])
+                ask_qty[best_ask] -= take
+                q -= take
+                volume += take
+                fills += 1
+                if ask_qty[best_ask] == 0:
+                    best_ask += 1
+                    while best_ask < num_levels and ask_qty[best_ask] == 0:
+                        best_ask += 1
+            if q > 0:
+                bid_qty[p] += q
+                if p > best_bid:
+                    best_bid = p
+        else:  # sell: hit bids priced at or above p
+            while q > 0 and best_bid >= 0 and best_bid >= p:
+                take = min(q, bid_qty[best_bid])
+                bid_qty[best_bid] -= take
+                q -= take
+                volume += take
+                fills += 1
+                if bid_qty[best_bid] == 0:
+                    best_bid -= 1
+                    while best_bid >= 0 and bid_qty[best_bid] == 0:
+                        best_bid -= 1
+            if q > 0:
+                ask_qty[p] += q
+                if p < best_ask:
+                    best_ask = p
+
+    return fills, volume
+
+
+def generate_workload(num_orders: int, num_levels: int = 20):
+    """Generate the same alternating-side tick workload as the Python benchmark"""
+    idx = np.arange(num_orders)
+    sides = (idx & 1).astype(np.int8)  # even = buy, odd = sell
+    price_idx = ((idx % 10) + 5).astype(np.int64)  # 10 ticks around mid
+    qtys = np.full(num_orders, 100, dtype=np.int64)
+    return price_idx, sides, qtys, num_levels
+
+
+def benchmark_jit_matching(num_orders: int = 100000) -> None:
+    """Run the array matching kernel and report throughput"""
+    price_idx, sides, qtys, num_levels = generate_workload(num_orders)
+
+    # Warm up compilation outside the timed region
+    warm_bids = np.zeros(num_levels, dtype=np.int64)
+    warm_asks = np.zeros(num_levels, dtype=np.int64)
+    match_limit_orders(price_idx[:64], sides[:64], qtys[:64], warm_bids, warm_asks)
+
+    bid_qty = np.zeros(num_levels, dtype=np.int64)
+    ask_qty = np.zeros(num_levels, dtype=np.int64)
+
+    start = time.perf_counter_ns()
+    fills, volume = match_limit_orders(price_idx, sides, qtys, bid_qty, ask_qty)
+    elapsed = (time.perf_counter_ns() - start) / 1e9
+
+    mode = "numba @njit" if NUMBA_AVAILABLE else "pure Python fallback"
+    print(f"\n📊 Array Matching Kernel ({num_orders:,} orders, {mode})")
+    print("-" * 60)
+    print(f"  Total Time:   {elapsed:.4f} seconds")
+    print(f"  Throughput:   {num_orders / elapsed:,.0f} orders/sec")
+    print(f"  Fills:        {fills:,}")
+    print(f"  Volume:       {volume:,}")
+
+
+def main():
+    print("=" * 60)
+    print("  NUMBA KERNEL BENCHMARK")
+    print("=" * 60)
+    if not NUMBA_AVAILABLE:
+        print("\n  numba not installed - running pure Python fallback.")
+        print("  Install with: pip install microstructurex[perf]")
+
+    benchmark_jit_matching(100000)
+    print()
+
+
+if __name__ == "__main__":
+    main()
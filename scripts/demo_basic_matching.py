@@ -12,11 +12,19 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from decimal import Decimal
+import numpy as np
 from src.engine.order_book import LimitOrderBook
-from src.engine.order import Order, OrderSide, OrderType, TimeInForce
+from src.engine.order import Order, OrderSide, OrderType, TimeInForce, PRICE_SCALE
 import time
 
 
+def as_price(ticks):
+    """Convert int64 tick count to Decimal price for display"""
+    if ticks is None:
+        return None
+    return Decimal(int(ticks)) / PRICE_SCALE
+
+
 def main():
     print("=" * 60)
     print("DEMO: Basic Order Matching")
@@ -31,10 +39,11 @@ def main():
     print("📖 Building order book with limit orders...")
     print("-" * 60)
 
+    # Prices as int64 ticks (100.50 -> 1_005_000 at PRICE_SCALE=10000)
     sell_orders = [
-        (Decimal("100.50"), Decimal("100"), "Trader A"),
-        (Decimal("100.51"), Decimal("150"), "Trader B"),
-        (Decimal("100.52"), Decimal("200"), "Trader C"),
+        (100 * PRICE_SCALE + 5000, 100, "Trader A"),
+        (100 * PRICE_SCALE + 5100, 150, "Trader B"),
+        (100 * PRICE_SCALE + 5200, 200, "Trader C"),
     ]
 
     for price, qty, owner in sell_orders:
@@ -49,13 +58,13 @@ def main():
             owner=owner
         )
         book.add_order(order)
-        print(f"  Added: SELL {qty} @ ${price} ({owner})")
+        print(f"  Added: SELL {qty} @ ${as_price(price)} ({owner})")
 
     # Add passive buy orders (build bid side)
     buy_orders = [
-        (Decimal("100.48"), Decimal("120"), "Trader D"),
-        (Decimal("100.47"), Decimal("180"), "Trader E"),
-        (Decimal("100.46"), Decimal("250"), "Trader F"),
+        (100 * PRICE_SCALE + 4800, 120, "Trader D"),
+        (100 * PRICE_SCALE + 4700, 180, "Trader E"),
+        (100 * PRICE_SCALE + 4600, 250, "Trader F"),
     ]
 
     for price, qty, owner in buy_orders:
@@ -70,7 +79,7 @@ def main():
             owner=owner
         )
         book.add_order(order)
-        print(f"  Added: BUY  {qty} @ ${price} ({owner})")
+        print(f"  Added: BUY  {qty} @ ${as_price(price)} ({owner})")
 
     print()
 
@@ -78,10 +87,10 @@ def main():
     snapshot = book.get_snapshot(levels=5)
     print("📊 Current Order Book State:")
     print("-" * 60)
-    print(f"  Best Bid: ${book.best_bid}")
-    print(f"  Best Ask: ${book.best_ask}")
-    print(f"  Spread:   ${book.spread}")
-    print(f"  Mid:      ${book.mid_price}")
+    print(f"  Best Bid: ${as_price(book.best_bid)}")
+    print(f"  Best Ask: ${as_price(book.best_ask)}")
+    print(f"  Spread:   ${as_price(book.spread)}")
+    print(f"  Mid:      ${as_price(book.mid_price)}")
     print()
 
     # Execute aggressive market buy order
@@ -94,8 +103,8 @@ def main():
         side=OrderSide.BUY,
         order_type=OrderType.MARKET,
         price=None,
-        quantity=Decimal("350"),  # Will sweep multiple levels
-        remaining_quantity=Decimal("350"),
+        quantity=350,  # Will sweep multiple levels
+        remaining_quantity=350,
         owner="Aggressive Buyer"
     )
 
@@ -103,13 +112,20 @@ def main():
 
     print(f"  Generated {len(trades)} trade(s):\n")
     for i, trade in enumerate(trades, 1):
-        print(f"  Trade {i}: {trade.quantity} shares @ ${trade.price}")
+        print(f"  Trade {i}: {trade.quantity} shares @ ${as_price(trade.price)}")
 
-    # Calculate execution VWAP
+    # Calculate execution VWAP (vectorized past ~64 trades, where the
+    # NumPy reduction beats two Python generator passes)
     if trades:
-        total_cost = sum(t.price * t.quantity for t in trades)
-        total_qty = sum(t.quantity for t in trades)
-        vwap = total_cost / total_qty
+        if len(trades) > 64:
+            px = np.fromiter((t.price for t in trades), np.int64, len(trades))
+            qs = np.fromiter((int(t.quantity) for t in trades), np.int64, len(trades))
+            total_qty = int(qs.sum())
+            vwap = as_price(int(np.dot(px, qs)) / total_qty)
+        else:
+            total_cost = sum(t.price * t.quantity for t in trades)
+            total_qty = sum(t.quantity for t in trades)
+            vwap = as_price(total_cost / total_qty)
         print(f"\n  Execution VWAP: ${vwap:.4f}")
         print(f"  Total Volume:   {total_qty} shares")
 
@@ -119,10 +135,10 @@ def main():
     snapshot = book.get_snapshot(levels=5)
     print("📊 Updated Order Book State:")
     print("-" * 60)
-    print(f"  Best Bid: ${book.best_bid}")
-    print(f"  Best Ask: ${book.best_ask}")
-    print(f"  Spread:   ${book.spread}")
-    print(f"  Mid:      ${book.mid_price}")
+    print(f"  Best Bid: ${as_price(book.best_bid)}")
+    print(f"  Best Ask: ${as_price(book.best_ask)}")
+    print(f"  Spread:   ${as_price(book.spread)}")
+    print(f"  Mid:      ${as_price(book.mid_price)}")
     print()
 
     # Show remaining depth
@@ -130,11 +146,11 @@ def main():
     print("-" * 60)
     print("  ASKS (Sell Orders):")
     for i, (price, qty) in enumerate(snapshot.asks[:3], 1):
-        print(f"    Level {i}: {qty} @ ${price}")
+        print(f"    Level {i}: {qty} @ ${as_price(price)}")
 
     print("\n  BIDS (Buy Orders):")
     for i, (price, qty) in enumerate(snapshot.bids[:3], 1):
-        print(f"    Level {i}: {qty} @ ${price}")
+        print(f"    Level {i}: {qty} @ ${as_price(price)}")
 
     print()
 
@@ -144,7 +160,7 @@ def main():
     print(f"  Total Orders Received: {book.total_orders_received}")
     print(f"  Total Trades:          {book.total_trades}")
     print(f"  Total Volume:          {book.total_volume} shares")
-    print(f"  Last Trade Price:      ${book.last_trade_price}")
+    print(f"  Last Trade Price:      ${as_price(book.last_trade_price)}")
 
     print()
     print("=" * 60)
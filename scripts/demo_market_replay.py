@@ -42,7 +42,7 @@ async def main():
     snapshot_count = 0
 
     # Register callbacks
-    async def on_snapshot(snapshot):
+    async def on_snapshot(snapshot, sim_time):
         nonlocal snapshot_count
         snapshot_count += 1
         snapshots.append(snapshot)
@@ -87,7 +87,7 @@ async def main():
 
         metrics = MetricsCalculator.compute_from_snapshots(
             snapshots=snapshots,
-            trades=book.trades
+            trades=book.trade_columns
         )
 
         print("  Spread Metrics:")
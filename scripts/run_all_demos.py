@@ -5,12 +5,15 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
-import subprocess
+import asyncio
+import inspect
 import time
 
+from scripts import demo_basic_matching, demo_market_replay, demo_twap_strategy
 
-def run_demo(script_name: str, description: str):
-    """Run a single demo script"""
+
+def run_demo(demo_main, description: str):
+    """Run a single demo in-process (shared interpreter and import graph)"""
     print("\n" + "🚀 " + "=" * 58)
     print(f"   Running: {description}")
     print("=" * 60)
@@ -18,13 +21,13 @@ def run_demo(script_name: str, description: str):
 
     time.sleep(1)
 
-    result = subprocess.run(
-        [sys.executable, str(Path(__file__).parent / script_name)],
-        capture_output=False
-    )
-
-    if result.returncode != 0:
-        print(f"\n❌ Demo failed with exit code {result.returncode}")
+    try:
+        if inspect.iscoroutinefunction(demo_main):
+            asyncio.run(demo_main())
+        else:
+            demo_main()
+    except Exception as e:
+        print(f"\n❌ Demo failed: {e}")
         return False
 
     print("\n⏸️  Press Enter to continue to next demo...")
@@ -45,13 +48,13 @@ def main():
     input()
 
     demos = [
-        ("demo_basic_matching.py", "Basic Order Matching"),
-        ("demo_market_replay.py", "Market Replay Engine"),
-        ("demo_twap_strategy.py", "TWAP Execution Strategy"),
+        (demo_basic_matching.main, "Basic Order Matching"),
+        (demo_market_replay.main, "Market Replay Engine"),
+        (demo_twap_strategy.main, "TWAP Execution Strategy"),
     ]
 
-    for script, description in demos:
-        success = run_demo(script, description)
+    for demo_main, description in demos:
+        success = run_demo(demo_main, description)
         if not success:
             print("\n❌ Demo suite stopped due to error.")
             sys.exit(1)
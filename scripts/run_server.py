@@ -1,13 +1,32 @@
 """
 Script to run the FastAPI server for the LOB engine.
+
+Defaults to a single-worker dev setup with auto-reload. For benchmark /
+production runs, configure via environment variables:
+
+    WORKERS=8 RELOAD=0 python scripts/run_server.py
+
+Note: with WORKERS > 1 each process gets its own in-memory order book;
+shared book state would need external state management (Redis/shared
+memory) before multi-worker is meaningful for the matching endpoints.
 """
+import os
+
 import uvicorn
 
 if __name__ == "__main__":
+    workers = int(os.getenv("WORKERS", "1"))
+    reload = os.getenv("RELOAD", "1") == "1" and workers == 1
+
     uvicorn.run(
         "src.api.server:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True,
-        log_level="info"
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        workers=workers,
+        reload=reload,
+        # uvicorn[standard] ships uvloop/httptools; "auto" picks them up
+        # where available and falls back gracefully elsewhere
+        loop="auto",
+        http="auto",
+        log_level=os.getenv("LOG_LEVEL", "info" if reload else "warning")
     )
@@ -33,6 +33,7 @@ setup(
         "pydantic>=2.5.0",
         "python-multipart>=0.0.6",
         "numpy>=1.24.0",
+        "sortedcontainers>=2.4.0",
         "pandas>=2.0.0",
         "pyarrow>=12.0.0",
     ],
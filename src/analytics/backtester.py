@@ -4,13 +4,14 @@ Strategy backtesting framework.
 from decimal import Decimal
 from typing import List, Dict, Optional
 from dataclasses import dataclass
-import time
 
-from ..engine.order_book import LimitOrderBook
-from ..engine.order import Order, Trade
+import numpy as np
+
+from ..engine.order_book import LimitOrderBook, TradesTable
+from ..engine.order import Order, OrderSide, Trade
 from ..strategies.base_strategy import ExecutionStrategy
 from ..replay.replay import ReplayEngine
-from ..analytics.metrics import MetricsCalculator
+from ..analytics.metrics import MetricsCalculator, SnapshotColumns
 
 
 @dataclass
@@ -53,9 +54,9 @@ class Backtester:
         self.order_book = order_book
         self.replay_engine = ReplayEngine(order_book, speed_multiplier=0)  # Tick-by-tick
         
-        # Results tracking
-        self.snapshots = []
-        self.strategy_trades = []
+        # Results tracking (snapshot and fill history are columnar, SoA)
+        self.snapshot_columns = SnapshotColumns()
+        self.strategy_trades = TradesTable()
         self.arrival_snapshot = None
     
     async def backtest_strategy(
@@ -73,42 +74,67 @@ class Backtester:
         Returns:
             BacktestResults with performance metrics
         """
-        self.snapshots = []
-        self.strategy_trades = []
+        # Preallocate for the expected snapshot count so the run never
+        # pays a resize; the doubling policy still covers overruns
+        expected_snapshots = int(duration_seconds / 0.5) + 16
+        self.snapshot_columns = SnapshotColumns(capacity=expected_snapshots)
+        self.strategy_trades = TradesTable()
         self.arrival_snapshot = None
-        
-        start_time = time.time()
-        
-        # Register callbacks
-        async def on_snapshot(snapshot):
-            self.snapshots.append(snapshot)
-            if self.arrival_snapshot is None:
-                self.arrival_snapshot = snapshot
-            
-            # Let strategy generate orders
-            elapsed = time.time() - start_time
-            orders = strategy.generate_orders(snapshot, elapsed)
-            
-            for order in orders:
-                trades = self.order_book.add_order(order)
-                
-                # Update strategy with fills
-                for trade in trades:
-                    # Determine if this trade filled our order
-                    if trade.buy_order_id == order.order_id or trade.sell_order_id == order.order_id:
-                        strategy.update_execution(order, trade.price, trade.quantity)
-                        self.strategy_trades.append(trade)
-        
-        self.replay_engine.register_callback("snapshot", on_snapshot)
+
+        self.replay_engine.register_callback(
+            "snapshot", self._make_snapshot_callback(strategy)
+        )
         
         # Run replay
         await self.replay_engine.replay_synthetic(duration_seconds, snapshot_interval=0.5)
         
         # Compute results
         results = self._compute_results(strategy)
-        
+
         return results
-    
+
+    def _make_snapshot_callback(self, strategy: ExecutionStrategy):
+        """
+        Build the replay snapshot callback specialized for one run.
+
+        Strategy and book are fixed for the duration of a backtest, so
+        the hot bound methods are hoisted into closure cells here; the
+        per-snapshot path then resolves them as local loads instead of
+        repeated attribute lookups. Elapsed time comes from the replay's
+        simulated clock, not the wall clock.
+        """
+        columns_append = self.snapshot_columns.append
+        trades_append = self.strategy_trades.append_trade
+        add_order = self.order_book.add_order
+        generate_orders = strategy.generate_orders
+        update_execution_batch = strategy.update_execution_batch
+        next_wakeup_time = strategy.next_wakeup_time
+
+        async def on_snapshot(snapshot, sim_time):
+            columns_append(snapshot)
+            if self.arrival_snapshot is None:
+                self.arrival_snapshot = snapshot
+
+            # Skip the strategy poll entirely when its schedule says
+            # nothing can fire yet; snapshot capture above still runs
+            if sim_time < next_wakeup_time():
+                return
+
+            # Let strategy generate orders
+            orders = generate_orders(snapshot, sim_time, timestamp_ns=snapshot.timestamp)
+
+            for order in orders:
+                trades = add_order(order)
+
+                # Every trade from our own submission has our order on
+                # one side, so the whole batch is credited in one call
+                if trades:
+                    update_execution_batch(trades)
+                    for trade in trades:
+                        trades_append(trade)
+
+        return on_snapshot
+
     def _compute_results(self, strategy: ExecutionStrategy) -> BacktestResults:
         """Compute backtest results from strategy execution"""
         
@@ -117,20 +143,18 @@ class Backtester:
         executed_qty = float(strategy.executed_quantity)
         fill_rate = executed_qty / target_qty if target_qty > 0 else 0
         
-        # VWAP
+        # VWAP: one dot product over the fill columns
         if executed_qty > 0:
-            total_cost = sum(
-                float(t.price * t.quantity) for t in self.strategy_trades
-            )
-            vwap = total_cost / executed_qty
+            fill_px, fill_qty, _ = self.strategy_trades.columns()
+            vwap = float(np.vdot(fill_px, fill_qty)) / executed_qty
         else:
             vwap = None
-        
+
         # Slippage
-        arrival_price = float(self.arrival_snapshot.mid_price) if self.arrival_snapshot and self.arrival_snapshot.mid_price else None
+        arrival_price = self.arrival_snapshot.mid_f if self.arrival_snapshot else None
         
         if arrival_price and vwap:
-            if strategy.side.value == "BUY":
+            if strategy.side is OrderSide.BUY:
                 slippage = vwap - arrival_price
             else:
                 slippage = arrival_price - vwap
@@ -140,11 +164,11 @@ class Backtester:
             slippage = 0
             slippage_bps = 0
         
-        # Compute market metrics
-        if len(self.snapshots) > 10:
-            metrics = MetricsCalculator.compute_from_snapshots(
-                self.snapshots,
-                self.order_book.trades
+        # Compute market metrics directly from the columnar history
+        if len(self.snapshot_columns) > 10:
+            metrics = MetricsCalculator.compute_from_columns(
+                self.snapshot_columns,
+                self.order_book.trade_columns
             )
             mean_spread = metrics.mean_spread
             realized_vol = metrics.realized_volatility
@@ -160,7 +184,7 @@ class Backtester:
             arrival_price=arrival_price,
             total_slippage=slippage,
             slippage_bps=slippage_bps,
-            num_child_orders=len(strategy.child_orders),
+            num_child_orders=strategy.child_order_count,
             num_fills=len(self.strategy_trades),
             execution_time=0,  # Would compute from timestamps
             mean_spread=mean_spread,
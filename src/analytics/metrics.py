@@ -1,13 +1,98 @@
 """
 Market microstructure metrics computation.
 """
-from decimal import Decimal
 from typing import List, Dict, Optional
 import numpy as np
 from dataclasses import dataclass
 
-from ..engine.order_book import OrderBookSnapshot
-from ..engine.order import Trade
+from ..engine.order_book import OrderBookSnapshot, TradesTable
+from ..engine.order import OrderSide, Trade
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+
+if _HAVE_NUMBA:
+    # No fastmath: the kernel relies on NaN self-comparison to detect
+    # missing sides, which fastmath's no-NaN assumption would break
+    @njit(cache=True)
+    def _snapshot_stats_kernel(mid, spread, bid_top, ask_top, bid_d5, ask_d5):
+        """
+        Fused single-pass reduction over the SoA snapshot columns.
+
+        NaN marks a missing side. Returns (mean_spread, spread_vol,
+        mean_depth_bid, mean_depth_ask, ofi, returns_mean, returns_std,
+        num_returns); variances are population (matches np.std).
+        """
+        s_sum = 0.0
+        s_sq = 0.0
+        s_n = 0
+        bd_sum = 0.0
+        bd_n = 0
+        ad_sum = 0.0
+        ad_n = 0
+        ofi_sum = 0.0
+        ofi_n = 0
+        r_sum = 0.0
+        r_sq = 0.0
+        r_n = 0
+        prev_mid = np.nan
+
+        for i in range(mid.shape[0]):
+            s = spread[i]
+            if s == s:
+                s_sum += s
+                s_sq += s * s
+                s_n += 1
+            b = bid_d5[i]
+            if b == b:
+                bd_sum += b
+                bd_n += 1
+            a = ask_d5[i]
+            if a == a:
+                ad_sum += a
+                ad_n += 1
+            bt = bid_top[i]
+            at = ask_top[i]
+            if bt == bt and at == at:
+                total = bt + at
+                if total > 0:
+                    ofi_sum += (bt - at) / total
+                    ofi_n += 1
+            m = mid[i]
+            if m == m:
+                if prev_mid == prev_mid:
+                    r = np.log(m / prev_mid)
+                    r_sum += r
+                    r_sq += r * r
+                    r_n += 1
+                prev_mid = m
+
+        mean_spread = 0.0
+        spread_vol = 0.0
+        if s_n:
+            mean_spread = s_sum / s_n
+            spread_vol = np.sqrt(max(s_sq / s_n - mean_spread * mean_spread, 0.0))
+        mean_depth_bid = bd_sum / bd_n if bd_n else 0.0
+        mean_depth_ask = ad_sum / ad_n if ad_n else 0.0
+        ofi = ofi_sum / ofi_n if ofi_n else 0.0
+        returns_mean = 0.0
+        returns_std = 0.0
+        if r_n:
+            returns_mean = r_sum / r_n
+            returns_std = np.sqrt(max(r_sq / r_n - returns_mean * returns_mean, 0.0))
+
+        return (mean_spread, spread_vol, mean_depth_bid, mean_depth_ask,
+                ofi, returns_mean, returns_std, r_n)
+
+    # Warm up compilation at import so the first /metrics request or
+    # backtest isn't hit by compile latency
+    _warm = np.array([np.nan, 1.0])
+    _snapshot_stats_kernel(_warm, _warm, _warm, _warm, _warm, _warm)
+    del _warm
 
 
 @dataclass
@@ -40,11 +125,85 @@ class MicrostructureMetrics:
     realized_volatility: float
 
 
+class SnapshotColumns:
+    """
+    Columnar (SoA) store of snapshot-derived scalars.
+
+    Holds one float64 column per metric input (mid, spread, top-of-book
+    volumes, timestamps) plus (N, 5) matrices of top-5 level quantities,
+    grown with a doubling policy. Metrics scans touch only the columns
+    they read instead of striding through OrderBookSnapshot objects.
+    """
+
+    __slots__ = (
+        'ts', 'mid', 'spread', 'bid_top_vol', 'ask_top_vol',
+        'bid_qty_top5', 'ask_qty_top5', '_size'
+    )
+
+    def __init__(self, capacity: int = 1024):
+        self.ts = np.empty(capacity, dtype=np.int64)
+        self.mid = np.empty(capacity)
+        self.spread = np.empty(capacity)
+        self.bid_top_vol = np.empty(capacity)
+        self.ask_top_vol = np.empty(capacity)
+        self.bid_qty_top5 = np.empty((capacity, 5))
+        self.ask_qty_top5 = np.empty((capacity, 5))
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _grow(self) -> None:
+        new_capacity = max(1024, len(self.ts) * 2)
+        for name in ('ts', 'mid', 'spread', 'bid_top_vol', 'ask_top_vol'):
+            setattr(self, name, np.resize(getattr(self, name), new_capacity))
+        # Row-major resize preserves existing rows
+        self.bid_qty_top5 = np.resize(self.bid_qty_top5, (new_capacity, 5))
+        self.ask_qty_top5 = np.resize(self.ask_qty_top5, (new_capacity, 5))
+
+    def append(self, snapshot: OrderBookSnapshot) -> None:
+        """Append one snapshot's columns (NaN = side not present)"""
+        if self._size == len(self.ts):
+            self._grow()
+
+        i = self._size
+        bid_qty = snapshot.bid_qty_f
+        ask_qty = snapshot.ask_qty_f
+
+        self.ts[i] = snapshot.timestamp
+        self.mid[i] = snapshot.mid_f if snapshot.mid_f is not None else np.nan
+        self.spread[i] = snapshot.spread_f if snapshot.spread_f is not None else np.nan
+        self.bid_top_vol[i] = bid_qty[0] if bid_qty.size else np.nan
+        self.ask_top_vol[i] = ask_qty[0] if ask_qty.size else np.nan
+
+        # Top-5 quantities as a zero-padded row copied from the SoA
+        # views; the depth-5 sums become one axis reduction at compute
+        # time
+        k = min(5, bid_qty.size)
+        bid_row = self.bid_qty_top5[i]
+        bid_row[:] = 0.0
+        bid_row[:k] = bid_qty[:k]
+        k = min(5, ask_qty.size)
+        ask_row = self.ask_qty_top5[i]
+        ask_row[:] = 0.0
+        ask_row[:k] = ask_qty[:k]
+
+        self._size = i + 1
+
+    def column(self, name: str) -> np.ndarray:
+        """Filled portion of a column"""
+        return getattr(self, name)[:self._size]
+
+
 class MetricsCalculator:
     """
     Computes market microstructure metrics from snapshots and trades.
     """
-    
+
+    # One-slot memo for repeated polls over unchanged inputs (key, value)
+    _cache_key = None
+    _cache_value: Optional[MicrostructureMetrics] = None
+
     @staticmethod
     def compute_from_snapshots(
         snapshots: List[OrderBookSnapshot],
@@ -52,93 +211,155 @@ class MetricsCalculator:
     ) -> MicrostructureMetrics:
         """
         Compute comprehensive metrics from snapshots and trades.
-        
+
+        Results are memoized on snapshot count, the last snapshot's
+        timestamp and top-of-book, trade count, and last trade id, so
+        polling with unchanged inputs returns the previous result
+        without re-scanning.
+
         Args:
             snapshots: List of order book snapshots
             trades: List of executed trades
-        
+
         Returns:
             MicrostructureMetrics with all computed values
         """
-        # Spread metrics
-        spreads = [
-            float(s.spread) for s in snapshots 
-            if s.spread is not None
-        ]
-        
-        mean_spread = np.mean(spreads) if spreads else 0
-        median_spread = np.median(spreads) if spreads else 0
-        spread_volatility = np.std(spreads) if spreads else 0
-        
-        # Depth metrics
-        bid_depths = []
-        ask_depths = []
-        
+        last = snapshots[-1] if snapshots else None
+        if not trades:
+            last_trade_key = 0
+        elif isinstance(trades, TradesTable):
+            last_trade_key = int(trades.ts[len(trades) - 1])
+        else:
+            last_trade_key = trades[-1].trade_id
+        key = (
+            len(snapshots),
+            last.timestamp if last else 0,
+            last.best_bid_f if last else None,
+            last.best_ask_f if last else None,
+            float(last.bids[0][1]) if last and last.bids else None,
+            float(last.asks[0][1]) if last and last.asks else None,
+            len(trades),
+            last_trade_key,
+        )
+        if key == MetricsCalculator._cache_key:
+            return MetricsCalculator._cache_value
+
+        columns = SnapshotColumns(capacity=max(1, len(snapshots)))
         for snapshot in snapshots:
-            if snapshot.bids:
-                bid_depth = sum(float(qty) for _, qty in snapshot.bids[:5])
-                bid_depths.append(bid_depth)
-            if snapshot.asks:
-                ask_depth = sum(float(qty) for _, qty in snapshot.asks[:5])
-                ask_depths.append(ask_depth)
-        
-        mean_depth_bid = np.mean(bid_depths) if bid_depths else 0
-        mean_depth_ask = np.mean(ask_depths) if ask_depths else 0
-        
+            columns.append(snapshot)
+        result = MetricsCalculator.compute_from_columns(columns, trades)
+
+        MetricsCalculator._cache_key = key
+        MetricsCalculator._cache_value = result
+        return result
+
+    @staticmethod
+    def compute_from_columns(
+        columns: SnapshotColumns,
+        trades: List[Trade]
+    ) -> MicrostructureMetrics:
+        """
+        Compute metrics directly from a SoA snapshot column store.
+
+        Args:
+            columns: SnapshotColumns with per-snapshot scalar columns
+            trades: Executed trades, as a Trade list or a TradesTable
+
+        Returns:
+            MicrostructureMetrics with all computed values
+        """
+        mid = columns.column('mid')
+        spread = columns.column('spread')
+        bid_top_vol = columns.column('bid_top_vol')
+        ask_top_vol = columns.column('ask_top_vol')
+
+        # Depth-5 sums: one C-level row reduction over the (N, 5) matrices,
+        # with missing sides (NaN top-of-book) masked back to NaN
+        bid_depth5 = columns.column('bid_qty_top5').sum(axis=1)
+        ask_depth5 = columns.column('ask_qty_top5').sum(axis=1)
+        bid_depth5[np.isnan(bid_top_vol)] = np.nan
+        ask_depth5[np.isnan(ask_top_vol)] = np.nan
+
+        # Median needs a selection, which stays outside the fused kernel
+        spreads = spread[~np.isnan(spread)]
+        median_spread = np.median(spreads) if spreads.size else 0
+
+        if _HAVE_NUMBA:
+            # Fused single-pass reduction over all snapshot columns
+            (mean_spread, spread_volatility, mean_depth_bid, mean_depth_ask,
+             order_flow_imbalance, returns_mean, returns_std, num_returns) = \
+                _snapshot_stats_kernel(mid, spread, bid_top_vol, ask_top_vol,
+                                       bid_depth5, ask_depth5)
+        else:
+            # Spread metrics
+            mean_spread = np.mean(spreads) if spreads.size else 0
+            spread_volatility = np.std(spreads) if spreads.size else 0
+
+            # Depth metrics
+            bid_depths = bid_depth5[~np.isnan(bid_depth5)]
+            ask_depths = ask_depth5[~np.isnan(ask_depth5)]
+            mean_depth_bid = np.mean(bid_depths) if bid_depths.size else 0
+            mean_depth_ask = np.mean(ask_depths) if ask_depths.size else 0
+
+            # Order flow imbalance (average across snapshots with both sides)
+            top_mask = ~np.isnan(bid_top_vol) & ~np.isnan(ask_top_vol)
+            top_total = bid_top_vol[top_mask] + ask_top_vol[top_mask]
+            nonzero = top_total > 0
+            if np.any(nonzero):
+                ofis = (bid_top_vol[top_mask][nonzero] - ask_top_vol[top_mask][nonzero]) / top_total[nonzero]
+                order_flow_imbalance = np.mean(ofis)
+            else:
+                order_flow_imbalance = 0
+
         # Depth imbalance
         total_depth = mean_depth_bid + mean_depth_ask
         if total_depth > 0:
             depth_imbalance = (mean_depth_bid - mean_depth_ask) / total_depth
         else:
             depth_imbalance = 0
-        
-        # Order flow imbalance (average across snapshots)
-        ofis = []
-        for snapshot in snapshots:
-            if snapshot.bids and snapshot.asks:
-                bid_vol = float(snapshot.bids[0][1]) if snapshot.bids else 0
-                ask_vol = float(snapshot.asks[0][1]) if snapshot.asks else 0
-                total = bid_vol + ask_vol
-                if total > 0:
-                    ofi = (bid_vol - ask_vol) / total
-                    ofis.append(ofi)
-        
-        order_flow_imbalance = np.mean(ofis) if ofis else 0
-        
-        # Trade metrics
-        buy_volume = sum(
-            float(t.quantity) for t in trades 
-            if t.aggressor_side.value == "BUY"
-        )
-        sell_volume = sum(
-            float(t.quantity) for t in trades 
-            if t.aggressor_side.value == "SELL"
-        )
-        
-        total_volume = sum(float(t.quantity) for t in trades)
-        
-        if trades and total_volume > 0:
-            vwap = sum(
-                float(t.price * t.quantity) for t in trades
-            ) / total_volume
+
+        # Trade metrics as columns + boolean side mask; a TradesTable
+        # already holds these columns, a Trade list gets materialized
+        num_trades = len(trades)
+        if isinstance(trades, TradesTable):
+            trade_px, trade_qty, is_buy = trades.columns()
+        else:
+            trade_px = np.fromiter((t.price_f for t in trades), np.float64, num_trades)
+            trade_qty = np.fromiter((t.qty_f for t in trades), np.float64, num_trades)
+            is_buy = np.fromiter(
+                (t.aggressor_side is OrderSide.BUY for t in trades), np.bool_, num_trades
+            )
+
+        buy_volume = float(trade_qty[is_buy].sum())
+        sell_volume = float(trade_qty[~is_buy].sum())
+        total_volume = float(trade_qty.sum())
+
+        if num_trades and total_volume > 0:
+            vwap = float(np.vdot(trade_px, trade_qty)) / total_volume
         else:
             vwap = None
-        
+
         # Price metrics (returns from mid prices)
-        mid_prices = [
-            float(s.mid_price) for s in snapshots 
-            if s.mid_price is not None
-        ]
-        
-        if len(mid_prices) > 1:
-            returns = np.diff(np.log(mid_prices))
-            returns_mean = np.mean(returns)
-            returns_std = np.std(returns)
-            realized_volatility = np.std(returns) * np.sqrt(len(returns))  # Annualized
+        if _HAVE_NUMBA:
+            realized_volatility = returns_std * np.sqrt(num_returns) if num_returns else 0  # Annualized
         else:
-            returns_mean = 0
-            returns_std = 0
-            realized_volatility = 0
+            mid_prices = mid[~np.isnan(mid)]
+
+            if mid_prices.size > 1:
+                # One materialized buffer: log in place of the filtered
+                # copy, difference into its own prefix, then accumulator
+                # reductions (sum / dot) instead of separate std passes
+                logm = np.log(mid_prices, out=mid_prices)
+                returns = np.subtract(logm[1:], logm[:-1], out=logm[:-1])
+                n = returns.size
+                returns_mean = float(returns.sum()) / n
+                variance = float(np.vdot(returns, returns)) / n - returns_mean ** 2
+                returns_std = np.sqrt(max(variance, 0.0))
+                realized_volatility = returns_std * np.sqrt(n)  # Annualized
+            else:
+                returns_mean = 0
+                returns_std = 0
+                realized_volatility = 0
         
         return MicrostructureMetrics(
             mean_spread=mean_spread,
@@ -150,7 +371,7 @@ class MetricsCalculator:
             order_flow_imbalance=order_flow_imbalance,
             buy_volume=buy_volume,
             sell_volume=sell_volume,
-            num_trades=len(trades),
+            num_trades=num_trades,
             total_volume=total_volume,
             vwap=vwap,
             returns_mean=returns_mean,
@@ -171,35 +392,52 @@ class MetricsCalculator:
         Simplified model: probability based on how often market trades through level.
         
         Args:
-            snapshots: Order book snapshots over time
+            snapshots: Order book snapshots over time, as a snapshot
+                list or a SnapshotColumns store
             price_offset_bps: Offset from mid in basis points
             side: "buy" or "sell"
             time_horizon_seconds: Time horizon for fill
-        
+
         Returns:
             Estimated fill probability [0, 1]
         """
-        fills = 0
-        total_samples = 0
-        
-        for snapshot in snapshots:
-            if not snapshot.mid_price:
-                continue
-            
-            offset_fraction = price_offset_bps / 10000
-            
+        # Work on float columns; a Decimal multiply per snapshot would
+        # dominate this scan. NaN marks a missing side, and NaN
+        # comparisons are False so they never count as fills.
+        offset_fraction = price_offset_bps * 1e-4
+
+        if isinstance(snapshots, SnapshotColumns):
+            # Columns are pre-materialized; touch prices follow from
+            # mid -/+ half spread without touching snapshot objects
+            mid = snapshots.column('mid')
+            half_spread = snapshots.column('spread') * 0.5
             if side == "buy":
-                # Limit buy: would fill if market trades at or below our price
-                limit_price = snapshot.mid_price * Decimal(str(1 - offset_fraction))
-                # Check if best ask trades through
-                if snapshot.best_ask and snapshot.best_ask <= limit_price:
-                    fills += 1
+                touch = mid + half_spread
             else:
-                # Limit sell: would fill if market trades at or above our price
-                limit_price = snapshot.mid_price * Decimal(str(1 + offset_fraction))
-                if snapshot.best_bid and snapshot.best_bid >= limit_price:
-                    fills += 1
-            
-            total_samples += 1
-        
+                touch = mid - half_spread
+        else:
+            n = len(snapshots)
+            mid = np.fromiter(
+                (s.mid_f if s.mid_f is not None else np.nan for s in snapshots),
+                np.float64, n
+            )
+            if side == "buy":
+                touch = np.fromiter(
+                    (s.best_ask_f if s.best_ask_f is not None else np.nan for s in snapshots),
+                    np.float64, n
+                )
+            else:
+                touch = np.fromiter(
+                    (s.best_bid_f if s.best_bid_f is not None else np.nan for s in snapshots),
+                    np.float64, n
+                )
+
+        if side == "buy":
+            # Limit buy: would fill if market trades at or below our price
+            fills = np.count_nonzero(touch <= mid * (1 - offset_fraction))
+        else:
+            # Limit sell: would fill if market trades at or above our price
+            fills = np.count_nonzero(touch >= mid * (1 + offset_fraction))
+
+        total_samples = int(np.count_nonzero(~np.isnan(mid)))
         return fills / total_samples if total_samples > 0 else 0
@@ -3,11 +3,28 @@ FastAPI server for LOB engine API and WebSocket streaming.
 """
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 from decimal import Decimal
 from typing import List, Optional
 import asyncio
+import itertools
 import json
+import time
+
+import numpy as np
+
+try:
+    import orjson
+    _HAVE_ORJSON = True
+
+    def _encode(message: dict) -> bytes:
+        return orjson.dumps(message)
+except ImportError:
+    _HAVE_ORJSON = False
+
+    def _encode(message: dict) -> bytes:
+        return json.dumps(message).encode()
 
 from ..engine.order_book import LimitOrderBook
 from ..engine.order import Order, OrderSide, OrderType, TimeInForce
@@ -18,7 +35,13 @@ from ..strategies.posting_strategy import PostingStrategy
 from ..analytics.backtester import Backtester
 
 
-app = FastAPI(title="Market Microstructure API", version="1.0.0")
+# orjson-backed responses skip FastAPI's jsonable_encoder walk and the
+# stdlib json encode on every float-heavy payload
+app = FastAPI(
+    title="Market Microstructure API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse if _HAVE_ORJSON else JSONResponse,
+)
 
 # Enable CORS
 app.add_middleware(
@@ -34,6 +57,9 @@ order_book = LimitOrderBook(symbol="TEST")
 replay_engine = ReplayEngine(order_book, speed_multiplier=1.0)
 active_websockets: List[WebSocket] = []
 
+# Monotonic API order ids; avoids re-reading book counters per submit
+_next_order_id = itertools.count(1)
+
 
 # Request/Response models
 class OrderRequest(BaseModel):
@@ -63,46 +89,60 @@ async def root():
 async def get_snapshot(levels: int = 10):
     """Get current order book snapshot"""
     snapshot = order_book.get_snapshot(levels=levels)
-    
+
+    # Columnar price/quantity arrays (cached SoA views on the snapshot)
+    # instead of per-level tuples; orjson serializes ndarrays natively
+    # (OPT_SERIALIZE_NUMPY), the stdlib fallback gets plain lists
+    bids_px = snapshot.bid_px_f
+    bids_qty = snapshot.bid_qty_f
+    asks_px = snapshot.ask_px_f
+    asks_qty = snapshot.ask_qty_f
+
     return {
         "timestamp": snapshot.timestamp,
-        "bids": [(float(p), float(q)) for p, q in snapshot.bids],
-        "asks": [(float(p), float(q)) for p, q in snapshot.asks],
-        "spread": float(snapshot.spread) if snapshot.spread else None,
-        "mid_price": float(snapshot.mid_price) if snapshot.mid_price else None,
-        "best_bid": float(snapshot.best_bid) if snapshot.best_bid else None,
-        "best_ask": float(snapshot.best_ask) if snapshot.best_ask else None,
+        "bids_px": bids_px if _HAVE_ORJSON else bids_px.tolist(),
+        "bids_qty": bids_qty if _HAVE_ORJSON else bids_qty.tolist(),
+        "asks_px": asks_px if _HAVE_ORJSON else asks_px.tolist(),
+        "asks_qty": asks_qty if _HAVE_ORJSON else asks_qty.tolist(),
+        "spread": snapshot.spread_f,
+        "mid_price": snapshot.mid_f,
+        "best_bid": snapshot.best_bid_f,
+        "best_ask": snapshot.best_ask_f,
     }
 
 
 @app.post("/orders/submit")
 async def submit_order(request: OrderRequest):
     """Submit a new order"""
+    # One Decimal conversion per field; the string round-trip is the
+    # expensive part, so never do it twice for the same value
+    quantity = Decimal(str(request.quantity))
+
     order = Order(
-        order_id=f"API_{order_book.total_orders_received + 1}",
-        timestamp=int(asyncio.get_event_loop().time() * 1e9),
+        order_id=f"API_{next(_next_order_id)}",
+        timestamp=time.time_ns(),
         side=OrderSide(request.side),
         order_type=OrderType(request.order_type),
         price=Decimal(str(request.price)) if request.price else None,
-        quantity=Decimal(str(request.quantity)),
-        remaining_quantity=Decimal(str(request.quantity)),
+        quantity=quantity,
+        remaining_quantity=quantity,
         owner=request.owner,
         time_in_force=TimeInForce.GTC
     )
-    
+
     trades = order_book.add_order(order)
-    
+
     # Broadcast to WebSocket clients
     await broadcast_order_event(order, trades)
-    
+
     return {
         "order_id": order.order_id,
         "status": order.status.value,
         "trades": [
             {
                 "trade_id": t.trade_id,
-                "price": float(t.price),
-                "quantity": float(t.quantity),
+                "price": t.price_f,
+                "quantity": t.qty_f,
                 "aggressor_side": t.aggressor_side.value
             }
             for t in trades
@@ -117,21 +157,38 @@ async def cancel_order(order_id: str):
     return {"success": success, "order_id": order_id}
 
 
+# One-slot /metrics memo keyed on book state; dashboards polling an
+# unchanged book get the previous response without recomputation
+_metrics_cache_key = None
+_metrics_cache_response = None
+
+
 @app.get("/metrics")
 async def get_metrics():
     """Get current microstructure metrics"""
+    global _metrics_cache_key, _metrics_cache_response
+
+    key = (
+        order_book.total_orders_received,
+        order_book.total_trades,
+        len(order_book.orders),
+    )
+    if key == _metrics_cache_key:
+        return _metrics_cache_response
+
     snapshot = order_book.get_snapshot(levels=10)
-    
+
     if order_book.trades:
-        # Get recent trades (last 100)
-        recent_trades = order_book.trades[-100:]
+        # Get recent trades (last 100; the book keeps a bounded deque)
+        trade_ring = order_book.trades
+        recent_trades = list(trade_ring)[-100:] if len(trade_ring) > 100 else list(trade_ring)
         
         # Mock snapshots for metrics (in production, maintain history)
         snapshots = [snapshot]
         
         metrics = MetricsCalculator.compute_from_snapshots(snapshots, recent_trades)
-        
-        return {
+
+        response = {
             "spread": {
                 "mean": metrics.mean_spread,
                 "median": metrics.median_spread,
@@ -159,7 +216,11 @@ async def get_metrics():
             }
         }
     else:
-        return {"message": "No trades yet"}
+        response = {"message": "No trades yet"}
+
+    _metrics_cache_key = key
+    _metrics_cache_response = response
+    return response
 
 
 @app.post("/replay/start")
@@ -233,13 +294,33 @@ async def backtest_strategy(request: StrategyBacktestRequest):
     }
 
 
+# Pub-sub tick for periodic updates: one producer task refreshes the
+# shared payload and pulses the event; every client just waits and
+# sends the same bytes, so the snapshot is built once per interval
+# rather than once per client
+_snapshot_tick = asyncio.Event()
+
+
+@app.on_event("startup")
+async def _start_snapshot_producer():
+    async def produce():
+        while True:
+            await asyncio.sleep(1)
+            if active_websockets:
+                _update_payload()
+                _snapshot_tick.set()
+                _snapshot_tick.clear()
+
+    asyncio.create_task(produce())
+
+
 # WebSocket endpoint for real-time streaming
 @app.websocket("/ws/orderbook")
 async def websocket_orderbook(websocket: WebSocket):
     """Stream real-time order book updates via WebSocket"""
     await websocket.accept()
     active_websockets.append(websocket)
-    
+
     try:
         # Send initial snapshot
         snapshot = order_book.get_snapshot()
@@ -252,29 +333,51 @@ async def websocket_orderbook(websocket: WebSocket):
             }
         })
         
-        # Keep connection alive
+        # Wait on the producer's tick and relay the shared payload
         while True:
-            await asyncio.sleep(1)
-            
-            # Send periodic updates
-            snapshot = order_book.get_snapshot()
-            await websocket.send_json({
-                "type": "update",
-                "data": {
-                    "bids": [(float(p), float(q)) for p, q in snapshot.bids[:5]],
-                    "asks": [(float(p), float(q)) for p, q in snapshot.asks[:5]],
-                    "mid_price": float(snapshot.mid_price) if snapshot.mid_price else None,
-                    "spread": float(snapshot.spread) if snapshot.spread else None
-                }
-            })
+            await _snapshot_tick.wait()
+            await websocket.send_bytes(_update_cache_payload)
     
     except WebSocketDisconnect:
         active_websockets.remove(websocket)
 
 
+# Cache of the last periodic update payload, keyed on book state so an
+# unchanged book is serialized once no matter how many clients poll it
+_update_cache_key = None
+_update_cache_payload = b""
+
+
+def _update_payload() -> bytes:
+    """Serialize the periodic order book update, reusing cached bytes"""
+    global _update_cache_key, _update_cache_payload
+
+    key = (
+        order_book.total_orders_received,
+        order_book.total_trades,
+        len(order_book.orders),
+    )
+    if key == _update_cache_key:
+        return _update_cache_payload
+
+    snapshot = order_book.get_snapshot()
+    _update_cache_payload = _encode({
+        "type": "update",
+        "data": {
+            "bids": [(float(p), float(q)) for p, q in snapshot.bids[:5]],
+            "asks": [(float(p), float(q)) for p, q in snapshot.asks[:5]],
+            "mid_price": float(snapshot.mid_price) if snapshot.mid_price else None,
+            "spread": float(snapshot.spread) if snapshot.spread else None
+        }
+    })
+    _update_cache_key = key
+    return _update_cache_payload
+
+
 async def broadcast_order_event(order: Order, trades: List):
     """Broadcast order event to all connected WebSocket clients"""
-    message = {
+    # Serialize once and fan the same bytes out to every client
+    payload = _encode({
         "type": "order",
         "order_id": order.order_id,
         "side": order.side.value,
@@ -282,16 +385,21 @@ async def broadcast_order_event(order: Order, trades: List):
         "quantity": float(order.quantity),
         "status": order.status.value,
         "trades": len(trades)
-    }
-    
-    disconnected = []
-    for ws in active_websockets:
-        try:
-            await ws.send_json(message)
-        except:
-            disconnected.append(ws)
-    
+    })
+
+    # Bounded per-client send so one unresponsive client can't stall the
+    # event loop; timeouts are treated the same as disconnects
+    results = await asyncio.gather(
+        *(asyncio.wait_for(ws.send_bytes(payload), timeout=0.05)
+          for ws in active_websockets),
+        return_exceptions=True
+    )
+
     # Clean up disconnected clients
+    disconnected = [
+        ws for ws, result in zip(active_websockets, results)
+        if isinstance(result, Exception)
+    ]
     for ws in disconnected:
         if ws in active_websockets:
             active_websockets.remove(ws)
@@ -2,14 +2,146 @@
 Data loaders for various market data formats.
 """
 import csv
+import io
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 from pathlib import Path
 import json
 
+import numpy as np
+
+try:
+    # C-extension JSON parsing for the legacy bids_json/asks_json
+    # parquet columns; stdlib json otherwise
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from ..engine.order import Trade, OrderSide, OrderBookSnapshot
 
 
+# Decimal instances interned by raw string: tick prices repeat heavily
+# across rows, so parsing each unique string once and sharing the object
+# cuts both parse time and memory. Cleared wholesale if it ever grows
+# past the cap (a pathological file with ~all-unique cells).
+_DEC_CACHE: dict = {}
+_DEC_CACHE_MAX = 100_000
+
+
+def _dec(raw: str) -> Decimal:
+    """Cached Decimal constructor for repeating price/size strings"""
+    value = _DEC_CACHE.get(raw)
+    if value is None:
+        if len(_DEC_CACHE) >= _DEC_CACHE_MAX:
+            _DEC_CACHE.clear()
+        value = _DEC_CACHE[raw] = Decimal(raw)
+    return value
+
+
+def _read_file_bytes(filepath: str) -> memoryview:
+    """
+    Map a file into memory for zero-copy sequential reads.
+
+    mmap avoids the per-buffer read() syscall + copy of buffered stdio;
+    MADV_SEQUENTIAL (where available) tells the kernel to read ahead
+    aggressively and drop pages behind the scan. Falls back to a single
+    full read on platforms without mmap support. The returned
+    memoryview keeps the underlying mapping alive.
+    """
+    with open(filepath, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty file or mmap-hostile filesystem
+            return memoryview(f.read())
+
+    if hasattr(mapped, 'madvise'):
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+    return memoryview(mapped)
+
+
+def _resolve_snapshot_columns(header: List[str]):
+    """
+    Resolve column indexes from a snapshot CSV header.
+
+    Returns (ts_idx, ltp_idx, bid_cols, ask_cols) where bid/ask_cols are
+    (price_idx, size_idx) pairs in level order. Resolving once lets the
+    row loop index plain lists instead of paying a dict build plus
+    f-string key hashing per cell (the DictReader tax).
+    """
+    col = {name: idx for idx, name in enumerate(header)}
+    ts_idx = col['timestamp']
+    ltp_idx = col.get('last_trade_price')
+
+    bid_cols = []
+    ask_cols = []
+    for prefix, out in (('bid', bid_cols), ('ask', ask_cols)):
+        i = 1
+        while f'{prefix}_price_{i}' in col:
+            out.append((col[f'{prefix}_price_{i}'], col[f'{prefix}_size_{i}']))
+            i += 1
+
+    return ts_idx, ltp_idx, bid_cols, ask_cols
+
+
+def _iter_snapshot_rows(rows, ts_idx, ltp_idx, bid_cols, ask_cols) -> Iterator[OrderBookSnapshot]:
+    """Yield snapshots from CSV rows using pre-resolved column indexes"""
+    for row in rows:
+        bids = []
+        for price_idx, size_idx in bid_cols:
+            value = row[price_idx]
+            if not value:
+                break
+            bids.append((_dec(value), _dec(row[size_idx])))
+
+        asks = []
+        for price_idx, size_idx in ask_cols:
+            value = row[price_idx]
+            if not value:
+                break
+            asks.append((_dec(value), _dec(row[size_idx])))
+
+        last_trade_price = None
+        if ltp_idx is not None and row[ltp_idx]:
+            last_trade_price = _dec(row[ltp_idx])
+
+        yield OrderBookSnapshot(
+            timestamp=int(row[ts_idx]),
+            bids=bids,
+            asks=asks,
+            last_trade_price=last_trade_price
+        )
+
+
+def iter_csv_snapshots(filepath: str) -> Iterator[OrderBookSnapshot]:
+    """
+    Stream order book snapshots from a CSV file one at a time.
+
+    O(1) memory in the file length; pair with feature generation to
+    pipeline parsing and computation instead of materializing the whole
+    history first. See load_csv_snapshots for the expected layout.
+
+    Args:
+        filepath: Path to CSV file
+
+    Yields:
+        OrderBookSnapshot objects in file order
+    """
+    with open(filepath, 'r', buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+
+        ts_idx, ltp_idx, bid_cols, ask_cols = _resolve_snapshot_columns(header)
+        yield from _iter_snapshot_rows(reader, ts_idx, ltp_idx, bid_cols, ask_cols)
+
+
 def load_csv_snapshots(filepath: str) -> List[OrderBookSnapshot]:
     """
     Load order book snapshots from CSV file.
@@ -23,43 +155,116 @@ def load_csv_snapshots(filepath: str) -> List[OrderBookSnapshot]:
     Returns:
         List of OrderBookSnapshot objects
     """
-    snapshots = []
+    return list(iter_csv_snapshots(filepath))
 
-    with open(filepath, 'r') as f:
-        reader = csv.DictReader(f)
 
-        for row in reader:
-            timestamp = int(row['timestamp'])
-
-            # Parse bids
-            bids = []
-            i = 1
-            while f'bid_price_{i}' in row and row[f'bid_price_{i}']:
-                price = Decimal(row[f'bid_price_{i}'])
-                size = Decimal(row[f'bid_size_{i}'])
-                bids.append((price, size))
-                i += 1
+def _parse_snapshot_byte_range(args) -> List[OrderBookSnapshot]:
+    """
+    Worker: parse all snapshot rows that *start* in [start, end).
 
-            # Parse asks
-            asks = []
-            i = 1
-            while f'ask_price_{i}' in row and row[f'ask_price_{i}']:
-                price = Decimal(row[f'ask_price_{i}'])
-                size = Decimal(row[f'ask_size_{i}'])
-                asks.append((price, size))
-                i += 1
+    Seeks to the range start and aligns to the next line start (the
+    previous worker owns the straddling line), then reads whole lines
+    until the range is exhausted.
+    """
+    filepath, start, end = args
 
-            last_trade_price = Decimal(row['last_trade_price']) if 'last_trade_price' in row and row['last_trade_price'] else None
+    data = _read_file_bytes(filepath)
+    raw = data.obj  # mmap (or bytes fallback); both support find()
 
-            snapshot = OrderBookSnapshot(
-                timestamp=timestamp,
-                bids=bids,
-                asks=asks,
-                last_trade_price=last_trade_price
-            )
-            snapshots.append(snapshot)
+    header_end = raw.find(b'\n') + 1
+    header = bytes(data[:header_end]).decode().rstrip('\r\n').split(',')
+
+    # Align by backing up one byte: the scan for the next newline then
+    # lands on either the preceding newline (start was already a line
+    # boundary) or the end of the straddling line owned by the previous
+    # range. The line crossing `end` belongs to this range.
+    begin = raw.find(b'\n', start - 1) + 1
+    stop = raw.find(b'\n', end - 1) + 1
+    if stop == 0:
+        stop = len(data)
+
+    ts_idx, ltp_idx, bid_cols, ask_cols = _resolve_snapshot_columns(header)
+    reader = csv.reader(io.StringIO(bytes(data[begin:stop]).decode()))
+    return list(_iter_snapshot_rows(reader, ts_idx, ltp_idx, bid_cols, ask_cols))
+
+
+def load_csv_snapshots_parallel(filepath: str, workers: int = None) -> List[OrderBookSnapshot]:
+    """
+    Load a large snapshot CSV with one worker process per byte range.
+
+    The file is split into roughly equal byte ranges, each aligned to
+    the next newline inside its worker, parsed independently, and
+    concatenated in order. Worth it for multi-hundred-MB files; small
+    files fall back to the single-threaded loader.
+
+    Args:
+        filepath: Path to CSV file
+        workers: Number of worker processes (defaults to cpu_count)
+
+    Returns:
+        List of OrderBookSnapshot objects in file order
+    """
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(filepath)
+
+    # Below this, process startup dominates any parse win
+    if workers <= 1 or size < (8 << 20):
+        return load_csv_snapshots(filepath)
+
+    bounds = [size * i // workers for i in range(workers + 1)]
+    # Skip the header line in the first range
+    with open(filepath, 'rb') as f:
+        bounds[0] = len(f.readline())
+
+    tasks = [(filepath, bounds[i], bounds[i + 1]) for i in range(workers)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        parts = executor.map(_parse_snapshot_byte_range, tasks)
+
+    return [snapshot for part in parts for snapshot in part]
+
+
+def load_csv_snapshots_fast(filepath: str, levels: int = 10):
+    """
+    Load snapshot CSV into columnar float64 arrays (requires pandas).
+
+    Parses the whole file with pandas' C engine instead of building a
+    Decimal per cell, so throughput is bounded by the parser rather
+    than by object construction. Wrap values in Decimal lazily at the
+    point of use if exact arithmetic is needed.
+
+    Args:
+        filepath: Path to CSV file (same layout as load_csv_snapshots)
+        levels: Maximum number of price levels to read per side
+
+    Returns:
+        (timestamps, bids, asks) where timestamps is int64 of shape (N,)
+        and bids/asks are float64 of shape (N, levels, 2) holding
+        (price, size) per slot, NaN where a level is absent
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        raise ImportError("pandas required for fast CSV loading. Install with: pip install pandas")
+
+    # memory_map parses straight out of the page cache instead of
+    # copying through read() buffers
+    df = pd.read_csv(filepath, engine='c', memory_map=True)
+    n = len(df)
+
+    timestamps = df['timestamp'].to_numpy(np.int64)
+    bids = np.full((n, levels, 2), np.nan)
+    asks = np.full((n, levels, 2), np.nan)
 
-    return snapshots
+    for side, out in (('bid', bids), ('ask', asks)):
+        for i in range(1, levels + 1):
+            price_col = f'{side}_price_{i}'
+            if price_col not in df.columns:
+                break
+            out[:, i - 1, 0] = df[price_col].to_numpy(np.float64, na_value=np.nan)
+            out[:, i - 1, 1] = df[f'{side}_size_{i}'].to_numpy(np.float64, na_value=np.nan)
+
+    return timestamps, bids, asks
 
 
 def load_csv_trades(filepath: str) -> List[Trade]:
@@ -86,8 +291,8 @@ def load_csv_trades(filepath: str) -> List[Trade]:
                 timestamp=int(row['timestamp']),
                 buy_order_id=row['buy_order_id'],
                 sell_order_id=row['sell_order_id'],
-                price=Decimal(row['price']),
-                quantity=Decimal(row['quantity']),
+                price=_dec(row['price']),
+                quantity=_dec(row['quantity']),
                 aggressor_side=OrderSide(row['aggressor_side'])
             )
             trades.append(trade)
@@ -137,42 +342,195 @@ def save_snapshots_csv(snapshots: List[OrderBookSnapshot], filepath: str, levels
             writer.writerow(row)
 
 
-def save_snapshots_parquet(snapshots: List[OrderBookSnapshot], filepath: str) -> None:
+def save_snapshots_parquet_columns(
+    snapshots: List[OrderBookSnapshot],
+    filepath: str,
+    levels: int = 10,
+    compression: str = "zstd",
+    chunk_rows: int = 65536
+) -> None:
     """
-    Save snapshots to Parquet format (requires pandas & pyarrow).
+    Save snapshots to a wide columnar Parquet file (requires pyarrow).
+
+    One float64 column per ladder slot (bid_px_0..N, bid_qty_0..N,
+    ask_px_0..N, ask_qty_0..N) plus int64 timestamp and float64 mid,
+    avoiding per-row string formatting entirely. Rows stream into a
+    ParquetWriter one row-group at a time, so peak memory is
+    O(chunk_rows) regardless of input length.
 
     Args:
         snapshots: List of snapshots
         filepath: Output parquet path
+        levels: Number of price levels per side
+        compression: Parquet compression codec
+        chunk_rows: Rows buffered per row-group
     """
     try:
-        import pandas as pd
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow required for Parquet support. Install with: pip install pyarrow")
+
+    fields = [('ts', pa.int64()), ('mid', pa.float64())]
+    for side in ('bid', 'ask'):
+        for i in range(levels):
+            fields.append((f'{side}_px_{i}', pa.float64()))
+            fields.append((f'{side}_qty_{i}', pa.float64()))
+    schema = pa.schema(fields)
+
+    def new_chunk():
+        return {name: [] for name in schema.names}
+
+    chunk = new_chunk()
+    rows = 0
+
+    # Dictionary encoding exploits heavily repeating tick prices
+    with pq.ParquetWriter(
+        filepath, schema,
+        compression=compression,
+        use_dictionary=True,
+    ) as writer:
+        for snap in snapshots:
+            chunk['ts'].append(snap.timestamp)
+            chunk['mid'].append(snap.mid_f)
+
+            # Cells come off the snapshot's cached float views, not
+            # per-cell float(Decimal) conversions
+            for side, px, qty in (
+                ('bid', snap.bid_px_f, snap.bid_qty_f),
+                ('ask', snap.ask_px_f, snap.ask_qty_f),
+            ):
+                n = min(px.size, levels)
+                for i in range(n):
+                    chunk[f'{side}_px_{i}'].append(px[i])
+                    chunk[f'{side}_qty_{i}'].append(qty[i])
+                for i in range(n, levels):
+                    chunk[f'{side}_px_{i}'].append(None)
+                    chunk[f'{side}_qty_{i}'].append(None)
+
+            rows += 1
+            if rows == chunk_rows:
+                writer.write_table(pa.Table.from_pydict(chunk, schema=schema))
+                chunk = new_chunk()
+                rows = 0
+
+        if rows:
+            writer.write_table(pa.Table.from_pydict(chunk, schema=schema))
+
+
+def save_snapshots_parquet(snapshots: List[OrderBookSnapshot], filepath: str, levels: int = 10) -> None:
+    """
+    Save snapshots to Parquet format (requires pyarrow).
+
+    Writes the wide columnar layout (one float64 column per ladder
+    slot); see save_snapshots_parquet_columns. The old layout embedded
+    the ladders as JSON strings per row, which was both larger on disk
+    and far slower to read back.
+
+    Args:
+        snapshots: List of snapshots
+        filepath: Output parquet path
+        levels: Number of price levels per side
+    """
+    save_snapshots_parquet_columns(snapshots, filepath, levels=levels)
+
+
+def _iter_snapshots_table(table) -> Iterator[OrderBookSnapshot]:
+    """
+    Yield snapshots from an Arrow table (or a table wrapping one batch).
+
+    Reads Arrow column arrays and reconstructs snapshots from numpy
+    scalars; no pandas iterrows, no per-row JSON parsing in the wide
+    layout. Handles both the wide columnar layout written by
+    save_snapshots_parquet_columns and the legacy layout that embedded
+    the ladders as JSON strings.
+    """
+    names = set(table.column_names)
+
+    if 'bid_px_0' in names:
+        # Wide columnar layout: gather ladder columns into (N, levels)
+        # matrices once, then slice per row
+        ts = table['ts'].to_numpy()
+        ladders = {}
+        for side in ('bid', 'ask'):
+            px_names = []
+            i = 0
+            while f'{side}_px_{i}' in names:
+                px_names.append(i)
+                i += 1
+            ladders[side] = (
+                np.column_stack([table[f'{side}_px_{i}'].to_numpy() for i in px_names]),
+                np.column_stack([table[f'{side}_qty_{i}'].to_numpy() for i in px_names]),
+            )
+
+        bid_px, bid_qty = ladders['bid']
+        ask_px, ask_qty = ladders['ask']
+
+        for i in range(len(ts)):
+            bids = [
+                (Decimal(str(p)), Decimal(str(q)))
+                for p, q in zip(bid_px[i], bid_qty[i]) if p == p
+            ]
+            asks = [
+                (Decimal(str(p)), Decimal(str(q)))
+                for p, q in zip(ask_px[i], ask_qty[i]) if p == p
+            ]
+            yield OrderBookSnapshot(
+                timestamp=int(ts[i]),
+                bids=bids,
+                asks=asks,
+                last_trade_price=None
+            )
+    else:
+        # Legacy JSON-per-row layout
+        ts = table['timestamp'].to_numpy()
+        bids_json = table['bids_json'].to_pylist()
+        asks_json = table['asks_json'].to_pylist()
+
+        for i in range(len(ts)):
+            bids = [(Decimal(str(p)), Decimal(str(q))) for p, q in _json_loads(bids_json[i])]
+            asks = [(Decimal(str(p)), Decimal(str(q))) for p, q in _json_loads(asks_json[i])]
+            yield OrderBookSnapshot(
+                timestamp=int(ts[i]),
+                bids=bids,
+                asks=asks,
+                last_trade_price=None
+            )
+
+
+def iter_snapshots_parquet(filepath: str, batch_size: int = 10_000) -> Iterator[OrderBookSnapshot]:
+    """
+    Stream snapshots from a Parquet file batch by batch (requires pyarrow).
+
+    Only batch_size rows are decoded and held at a time, so memory is
+    O(batch_size) rather than O(file); row-group boundaries from the
+    streaming writer make the batched reads cheap.
+
+    Args:
+        filepath: Path to parquet file
+        batch_size: Rows decoded per Arrow batch
+
+    Yields:
+        OrderBookSnapshot objects in file order
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
     except ImportError:
-        raise ImportError("pandas required for Parquet support. Install with: pip install pandas pyarrow")
-
-    # Convert to flat records
-    records = []
-    for snap in snapshots:
-        record = {
-            'timestamp': snap.timestamp,
-            'best_bid': float(snap.best_bid) if snap.best_bid else None,
-            'best_ask': float(snap.best_ask) if snap.best_ask else None,
-            'mid_price': float(snap.mid_price) if snap.mid_price else None,
-            'spread': float(snap.spread) if snap.spread else None,
-            'bid_depth': sum(float(qty) for _, qty in snap.bids),
-            'ask_depth': sum(float(qty) for _, qty in snap.asks),
-            'bids_json': json.dumps([(float(p), float(q)) for p, q in snap.bids]),
-            'asks_json': json.dumps([(float(p), float(q)) for p, q in snap.asks]),
-        }
-        records.append(record)
-
-    df = pd.DataFrame(records)
-    df.to_parquet(filepath, index=False)
+        raise ImportError("pyarrow required for Parquet support. Install with: pip install pyarrow")
+
+    parquet_file = pq.ParquetFile(filepath)
+    for batch in parquet_file.iter_batches(batch_size=batch_size):
+        yield from _iter_snapshots_table(pa.Table.from_batches([batch]))
 
 
 def load_snapshots_parquet(filepath: str) -> List[OrderBookSnapshot]:
     """
-    Load snapshots from Parquet format.
+    Load snapshots from Parquet format (requires pyarrow).
+
+    Materializes the whole file; use iter_snapshots_parquet to stream
+    large histories instead. Handles both the wide columnar layout and
+    the legacy JSON-embedded layout.
 
     Args:
         filepath: Path to parquet file
@@ -181,26 +539,40 @@ def load_snapshots_parquet(filepath: str) -> List[OrderBookSnapshot]:
         List of OrderBookSnapshot objects
     """
     try:
-        import pandas as pd
+        import pyarrow.parquet as pq
     except ImportError:
-        raise ImportError("pandas required for Parquet support. Install with: pip install pandas pyarrow")
+        raise ImportError("pyarrow required for Parquet support. Install with: pip install pyarrow")
 
-    df = pd.read_parquet(filepath)
+    return list(_iter_snapshots_table(pq.read_table(filepath)))
 
-    snapshots = []
-    for _, row in df.iterrows():
-        bids = [(Decimal(str(p)), Decimal(str(q))) for p, q in json.loads(row['bids_json'])]
-        asks = [(Decimal(str(p)), Decimal(str(q))) for p, q in json.loads(row['asks_json'])]
 
-        snapshot = OrderBookSnapshot(
-            timestamp=int(row['timestamp']),
-            bids=bids,
-            asks=asks,
-            last_trade_price=None
-        )
-        snapshots.append(snapshot)
+def load_lobster_messages_fast(message_file: str) -> dict:
+    """
+    Load a LOBSTER message file into columnar arrays.
+
+    The message file is pure numeric CSV, so the whole parse runs in
+    NumPy's C reader instead of an int()/Decimal() Python loop per row.
+
+    Args:
+        message_file: Path to LOBSTER message file
+
+    Returns:
+        Dict of column arrays: 'timestamp' (int64 nanoseconds),
+        'event_type', 'order_id', 'direction' (int64), and
+        'size', 'price' (float64)
+    """
+    data = np.loadtxt(message_file, delimiter=',', dtype=np.float64, ndmin=2)
+    if data.size == 0:
+        data = data.reshape(0, 6)
 
-    return snapshots
+    return {
+        'timestamp': (data[:, 0] * 1e9).astype(np.int64),
+        'event_type': data[:, 1].astype(np.int64),
+        'order_id': data[:, 2].astype(np.int64),
+        'size': data[:, 3],
+        'price': data[:, 4],
+        'direction': data[:, 5].astype(np.int64),
+    }
 
 
 def load_lobster_data(message_file: str, orderbook_file: str = None) -> Tuple[List[dict], List[OrderBookSnapshot]]:
@@ -230,8 +602,8 @@ def load_lobster_data(message_file: str, orderbook_file: str = None) -> Tuple[Li
                     'timestamp': int(float(row[0]) * 1e9),  # Convert to nanoseconds
                     'event_type': int(row[1]),
                     'order_id': int(row[2]),
-                    'size': Decimal(row[3]),
-                    'price': Decimal(row[4]),
+                    'size': _dec(row[3]),
+                    'price': _dec(row[4]),
                     'direction': int(row[5])
                 }
                 messages.append(msg)
@@ -258,9 +630,9 @@ def load_lobster_data(message_file: str, orderbook_file: str = None) -> Tuple[Li
                     bid_size_idx = num_levels * 2 + level * 2 + 1
 
                     if ask_price_idx < len(row) and row[ask_price_idx]:
-                        asks.append((Decimal(row[ask_price_idx]), Decimal(row[ask_size_idx])))
+                        asks.append((_dec(row[ask_price_idx]), _dec(row[ask_size_idx])))
                     if bid_price_idx < len(row) and row[bid_price_idx]:
-                        bids.append((Decimal(row[bid_price_idx]), Decimal(row[bid_size_idx])))
+                        bids.append((_dec(row[bid_price_idx]), _dec(row[bid_size_idx])))
 
                 snapshot = OrderBookSnapshot(
                     timestamp=messages[i]['timestamp'] if i < len(messages) else int(i * 1e9),
@@ -5,6 +5,8 @@ from decimal import Decimal
 from typing import Optional
 import math
 
+import numpy as np
+
 from .order import Order, OrderBookSnapshot
 
 
@@ -22,74 +24,146 @@ class MarketImpactModel:
         self,
         model_type: str = "square_root",
         impact_coefficient: float = 0.1,
-        temporary_impact_ratio: float = 0.6
+        temporary_impact_ratio: float = 0.6,
+        liquidity_source: Optional[str] = None
     ):
         """
         Initialize impact model.
-        
+
         Args:
             model_type: "linear", "square_root", or "permanent_temporary"
             impact_coefficient: Impact strength parameter
             temporary_impact_ratio: Ratio of temporary to total impact (0-1)
+            liquidity_source: "adv" or "best_level" to freeze the
+                participation normalizer at construction; None keeps
+                the per-call choice based on whether adv is passed
         """
         self.model_type = model_type
         self.impact_coefficient = impact_coefficient
         self.temporary_impact_ratio = temporary_impact_ratio
-    
+        # All model-shape decisions resolve here, once: the bps scale
+        # (with the permanent+temporary multiplier folded in — 1/(1-r)
+        # == 1 + r/(1-r)), whether the size term is concave, and which
+        # participation normalizer to call. estimate_impact itself is
+        # branch-free on model type.
+        self._bps = impact_coefficient * 10000.0
+        self._pt_multiplier = 1.0 / (1.0 - temporary_impact_ratio)
+        self._scale = self._bps * (
+            self._pt_multiplier if model_type == "permanent_temporary" else 1.0
+        )
+        self._concave = model_type != "linear"
+        if liquidity_source == "adv":
+            self._participation_fn = self._participation_adv
+        elif liquidity_source == "best_level":
+            self._participation_fn = self._participation_best_level
+        else:
+            self._participation_fn = None
+
+    @staticmethod
+    def _participation_adv(order: Order, snapshot: OrderBookSnapshot, adv) -> float:
+        """Participation rate normalized by average daily volume"""
+        return float(order.quantity) / float(adv)
+
+    @staticmethod
+    def _participation_best_level(
+        order: Order,
+        snapshot: OrderBookSnapshot,
+        adv
+    ) -> Optional[float]:
+        """Participation rate using depth at the touch as proxy"""
+        quantity = float(order.quantity)
+
+        if order.is_buy() and snapshot.ask_qty_f.size:
+            available_liquidity = snapshot.ask_qty_f[0]
+        elif order.is_sell() and snapshot.bid_qty_f.size:
+            available_liquidity = snapshot.bid_qty_f[0]
+        else:
+            return None
+
+        return quantity / max(available_liquidity, quantity)
+
     def estimate_impact(
         self,
         order: Order,
         snapshot: OrderBookSnapshot,
         adv: Optional[Decimal] = None  # Average Daily Volume
-    ) -> Decimal:
+    ) -> float:
         """
         Estimate price impact for an order.
-        
+
+        Runs entirely in float64 off the snapshot's cached views; wrap
+        the result in Decimal at the boundary if exact arithmetic is
+        needed downstream.
+
         Args:
             order: Order to estimate impact for
             snapshot: Current order book snapshot
             adv: Average daily volume (for normalization)
-        
+
         Returns:
             Estimated impact in price units (bps or absolute)
         """
-        if snapshot.mid_price is None:
-            return Decimal(0)
-        
-        # Normalize size by ADV if provided
-        if adv is not None and adv > 0:
-            participation_rate = float(order.quantity / adv)
-        else:
-            # Use depth at best level as proxy
-            if order.is_buy() and snapshot.asks:
-                available_liquidity = snapshot.asks[0][1]
-            elif order.is_sell() and snapshot.bids:
-                available_liquidity = snapshot.bids[0][1]
-            else:
-                return Decimal(0)
-            
-            participation_rate = float(order.quantity / max(available_liquidity, order.quantity))
-        
-        mid_price = float(snapshot.mid_price)
-        
-        if self.model_type == "linear":
-            # Linear impact: impact = coeff * size
-            impact_bps = self.impact_coefficient * participation_rate * 10000
-        elif self.model_type == "square_root":
-            # Square-root impact: impact = coeff * sqrt(size)
-            impact_bps = self.impact_coefficient * math.sqrt(participation_rate) * 10000
-        else:  # permanent_temporary
-            # Decompose into permanent and temporary
-            permanent_impact = self.impact_coefficient * math.sqrt(participation_rate) * 10000
-            temporary_impact = permanent_impact * self.temporary_impact_ratio / (1 - self.temporary_impact_ratio)
-            impact_bps = permanent_impact + temporary_impact
-        
+        mid_price = snapshot.mid_f
+        if mid_price is None:
+            return 0.0
+
+        participation_fn = self._participation_fn
+        if participation_fn is None:
+            participation_fn = (
+                self._participation_adv if adv is not None and adv > 0
+                else self._participation_best_level
+            )
+
+        participation_rate = participation_fn(order, snapshot, adv)
+        if participation_rate is None:
+            return 0.0
+
+        if self._concave:
+            participation_rate = math.sqrt(participation_rate)
+        impact_bps = self._scale * participation_rate
+
         # Convert bps to price units
-        impact = Decimal(mid_price * impact_bps / 10000)
-        
+        impact = mid_price * impact_bps * 1e-4
+
         # Apply sign based on order side
         return impact if order.is_buy() else -impact
-    
+
+    def estimate_impact_batch(
+        self,
+        quantities: np.ndarray,
+        is_buy: np.ndarray,
+        liquidities: np.ndarray,
+        mid_prices: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized impact estimate over arrays of orders.
+
+        One numpy expression replaces the per-order Python call in
+        backtest sweeps; sqrt and the bps conversion run element-wise
+        over the whole batch.
+
+        Args:
+            quantities: Order quantities, float64 shape (N,)
+            is_buy: Boolean mask, True where the order is a buy
+            liquidities: Per-order normalizer — ADV if available, else
+                depth at the order's touch level
+            mid_prices: Mid price per order, float64 shape (N,)
+
+        Returns:
+            Signed impact per order in price units, float64 shape (N,)
+        """
+        participation = quantities / np.maximum(liquidities, quantities)
+
+        if self.model_type == "linear":
+            impact_bps = self._bps * participation
+        else:
+            impact_bps = self._bps * np.sqrt(participation)
+            if self.model_type == "permanent_temporary":
+                impact_bps *= self._pt_multiplier
+
+        impact = mid_prices * impact_bps * 1e-4
+        return np.where(is_buy, impact, -impact)
+
     def estimate_slippage(
         self,
         order: Order,
@@ -125,7 +199,7 @@ class DepthAnalyzer:
         snapshot: OrderBookSnapshot,
         side: str,  # "buy" or "sell"
         target_quantity: Decimal
-    ) -> tuple[Decimal, bool]:
+    ) -> tuple[float, bool]:
         """
         Calculate VWAP if executing target quantity immediately.
         
@@ -137,25 +211,28 @@ class DepthAnalyzer:
         Returns:
             (vwap_price, is_fully_fillable)
         """
-        levels = snapshot.asks if side == "buy" else snapshot.bids
-        
-        remaining = target_quantity
-        total_cost = Decimal(0)
-        
-        for price, quantity in levels:
-            if remaining <= 0:
-                break
-            
-            fill_qty = min(remaining, quantity)
-            total_cost += price * fill_qty
-            remaining -= fill_qty
-        
-        if remaining > 0:
+        # Vectorized walk over the snapshot's SoA ladder views: a
+        # cumulative sum locates the last touched level, a dot product
+        # prices the full levels, and only the partial fill is scalar
+        if side == "buy":
+            px, qty = snapshot.ask_px_f, snapshot.ask_qty_f
+        else:
+            px, qty = snapshot.bid_px_f, snapshot.bid_qty_f
+
+        target = float(target_quantity)
+        if target <= 0:
+            return 0.0, True
+
+        cum_qty = np.cumsum(qty)
+        if cum_qty.size == 0 or cum_qty[-1] < target:
             # Could not fill completely
-            return Decimal(0), False
-        
-        vwap = total_cost / target_quantity
-        return vwap, True
+            return 0.0, False
+
+        k = int(np.searchsorted(cum_qty, target))
+        filled_before = cum_qty[k - 1] if k else 0.0
+        cost = float(np.dot(px[:k], qty[:k])) + float(px[k]) * (target - filled_before)
+
+        return cost / target, True
     
     @staticmethod
     def calculate_order_flow_imbalance(snapshot: OrderBookSnapshot, levels: int = 5) -> float:
@@ -171,11 +248,43 @@ class DepthAnalyzer:
         Returns:
             OFI metric in [-1, 1] range
         """
-        bid_volume = sum(qty for _, qty in snapshot.bids[:levels])
-        ask_volume = sum(qty for _, qty in snapshot.asks[:levels])
-        
+        # Vector reductions over the snapshot's cached SoA quantity
+        # views instead of Decimal adds in a Python generator
+        bid_volume = float(snapshot.bid_qty_f[:levels].sum())
+        ask_volume = float(snapshot.ask_qty_f[:levels].sum())
+
         total_volume = bid_volume + ask_volume
         if total_volume == 0:
             return 0.0
-        
-        return float((bid_volume - ask_volume) / total_volume)
+
+        return (bid_volume - ask_volume) / total_volume
+
+    @staticmethod
+    def calculate_ofi_batch(
+        bid_qty: np.ndarray,
+        ask_qty: np.ndarray,
+        levels: int = 5
+    ) -> np.ndarray:
+        """
+        Order flow imbalance over a batch of snapshots.
+
+        Row reductions over (N, L) quantity matrices (e.g. the
+        SnapshotColumns top-5 blocks); NaN padding for absent levels is
+        ignored. Rows with no volume on either side return 0.
+
+        Args:
+            bid_qty: Bid quantities, float64 shape (N, L)
+            ask_qty: Ask quantities, float64 shape (N, L)
+            levels: Number of levels to include
+
+        Returns:
+            OFI per snapshot, float64 shape (N,)
+        """
+        bid_volume = np.nansum(bid_qty[:, :levels], axis=1)
+        ask_volume = np.nansum(ask_qty[:, :levels], axis=1)
+
+        total = bid_volume + ask_volume
+        return np.divide(
+            bid_volume - ask_volume, total,
+            out=np.zeros_like(total), where=total != 0
+        )
@@ -3,10 +3,33 @@ Order data structures and enums for the matching engine.
 """
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Optional, Union
 from decimal import Decimal
 import time
 
+import numpy as np
+
+
+# Fixed-point price scaling: 1 price unit == PRICE_SCALE ticks.
+# Hot paths represent prices as int64 tick counts (price * PRICE_SCALE)
+# and convert to Decimal only at presentation/API boundaries.
+PRICE_SCALE = 10000
+
+# Shared Decimal constants: the hot conversion and fill paths reuse
+# these instead of coercing fresh Decimals per call
+_PRICE_SCALE_D = Decimal(PRICE_SCALE)
+_D0 = Decimal(0)
+
+
+def to_ticks(value) -> int:
+    """Convert a Decimal (or numeric) price/quantity to int ticks"""
+    return round(value * PRICE_SCALE)
+
+
+def from_ticks(ticks: int) -> Decimal:
+    """Convert int ticks back to a Decimal price/quantity"""
+    return Decimal(ticks) / _PRICE_SCALE_D
+
 
 class OrderSide(Enum):
     """Order side: BUY or SELL"""
@@ -36,11 +59,11 @@ class OrderStatus(Enum):
     REJECTED = "REJECTED"
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """
     Represents a single order in the order book.
-    
+
     Attributes:
         order_id: Unique identifier for the order
         timestamp: Order creation timestamp (nanoseconds)
@@ -63,33 +86,87 @@ class Order:
     owner: str
     time_in_force: TimeInForce = TimeInForce.GTC
     status: OrderStatus = OrderStatus.NEW
-    
+    # Fixed-point views used by the matching engine: price and unfilled
+    # quantity as int ticks, so the hot loop compares and subtracts
+    # machine ints instead of boxed Decimals
+    price_t: Optional[int] = field(init=False, repr=False, default=None)
+    remaining_t: int = field(init=False, repr=False, default=0)
+    # Intrusive FIFO links managed by the owning PriceLevel; make
+    # cancellation an O(1) unlink instead of a linear queue scan
+    prev: Optional["Order"] = field(init=False, repr=False, default=None)
+    next: Optional["Order"] = field(init=False, repr=False, default=None)
+    level: Optional[object] = field(init=False, repr=False, default=None)
+
     def __post_init__(self):
         """Validate order on creation"""
-        if self.order_type == OrderType.LIMIT and self.price is None:
+        if self.order_type is OrderType.LIMIT and self.price is None:
             raise ValueError("Limit orders must have a price")
-        if self.order_type == OrderType.MARKET and self.price is not None:
+        if self.order_type is OrderType.MARKET and self.price is not None:
             raise ValueError("Market orders cannot have a price")
         if self.quantity <= 0:
             raise ValueError("Order quantity must be positive")
         if self.remaining_quantity < 0:
             raise ValueError("Remaining quantity cannot be negative")
-    
+
+        if self.price is not None:
+            self.price_t = to_ticks(self.price)
+        self.remaining_t = to_ticks(self.remaining_quantity)
+
+    @classmethod
+    def from_tick_values(
+        cls,
+        order_id: str,
+        timestamp: int,
+        side: OrderSide,
+        order_type: OrderType,
+        price_t: Optional[int],
+        qty_t: int,
+        owner: str,
+        time_in_force: TimeInForce = TimeInForce.GTC
+    ) -> "Order":
+        """
+        Fast constructor for callers that already hold tick values.
+
+        Skips __post_init__ validation and the Decimal-to-tick
+        re-derivation; the caller guarantees qty_t is positive and
+        price_t is present exactly for limit orders. Bulk generators
+        and loaders use this; external callers should stick to the
+        validating Decimal constructor.
+        """
+        self = object.__new__(cls)
+        self.order_id = order_id
+        self.timestamp = timestamp
+        self.side = side
+        self.order_type = order_type
+        self.price = from_ticks(price_t) if price_t is not None else None
+        quantity = from_ticks(qty_t)
+        self.quantity = quantity
+        self.remaining_quantity = quantity
+        self.owner = owner
+        self.time_in_force = time_in_force
+        self.status = OrderStatus.NEW
+        self.price_t = price_t
+        self.remaining_t = qty_t
+        self.prev = None
+        self.next = None
+        self.level = None
+        return self
+
     def is_buy(self) -> bool:
         """Check if order is a buy order"""
-        return self.side == OrderSide.BUY
+        return self.side is OrderSide.BUY
     
     def is_sell(self) -> bool:
         """Check if order is a sell order"""
-        return self.side == OrderSide.SELL
+        return self.side is OrderSide.SELL
     
     def is_limit(self) -> bool:
         """Check if order is a limit order"""
-        return self.order_type == OrderType.LIMIT
+        return self.order_type is OrderType.LIMIT
     
     def is_market(self) -> bool:
         """Check if order is a market order"""
-        return self.order_type == OrderType.MARKET
+        return self.order_type is OrderType.MARKET
     
     def is_filled(self) -> bool:
         """Check if order is completely filled"""
@@ -109,39 +186,69 @@ class Order:
             raise ValueError(
                 f"Fill quantity {quantity} exceeds remaining {self.remaining_quantity}"
             )
-        
+
         self.remaining_quantity -= quantity
-        
+        self.remaining_t = to_ticks(self.remaining_quantity)
+
         if self.remaining_quantity == 0:
             self.status = OrderStatus.FILLED
-        elif self.status == OrderStatus.NEW:
+        elif self.status is OrderStatus.NEW:
             self.status = OrderStatus.PARTIAL_FILL
 
+    def fill_ticks(self, qty_t: int) -> None:
+        """
+        Tick-path fill used by the matching engine.
+
+        The caller has already clamped qty_t to the remaining quantity
+        (the min() in the matching loop), so no revalidation; the
+        Decimal view is kept in sync for API readers.
+        """
+        remaining = self.remaining_t - qty_t
+        self.remaining_t = remaining
+
+        if remaining == 0:
+            self.remaining_quantity = _D0
+            self.status = OrderStatus.FILLED
+        else:
+            self.remaining_quantity = from_ticks(remaining)
+            if self.status is OrderStatus.NEW:
+                self.status = OrderStatus.PARTIAL_FILL
 
-@dataclass
+
+@dataclass(slots=True)
 class Trade:
     """
     Represents an executed trade between two orders.
-    
+
     Attributes:
-        trade_id: Unique trade identifier
+        trade_id: Unique trade identifier (book-generated trades use a
+            monotonic int sequence; format for display at the boundary)
         timestamp: Trade execution timestamp (nanoseconds)
         buy_order_id: ID of the buy order
         sell_order_id: ID of the sell order
         price: Execution price
         quantity: Executed quantity
         aggressor_side: Side that initiated the trade (took liquidity)
+        price_f: Float view of price, cached at creation for analytics
+        qty_f: Float view of quantity, cached at creation for analytics
     """
-    trade_id: str
+    trade_id: Union[int, str]
     timestamp: int
     buy_order_id: str
     sell_order_id: str
     price: Decimal
     quantity: Decimal
     aggressor_side: OrderSide
+    price_f: float = field(init=False, repr=False)
+    qty_f: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Cache float conversions once; metrics paths read these"""
+        self.price_f = float(self.price)
+        self.qty_f = float(self.quantity)
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderBookSnapshot:
     """
     Snapshot of the order book state at a point in time.
@@ -158,27 +265,63 @@ class OrderBookSnapshot:
     bids: list[tuple[Decimal, Decimal]]
     asks: list[tuple[Decimal, Decimal]]
     last_trade_price: Optional[Decimal] = None
-    
+    # Float views cached at creation so analytics scans are pure
+    # attribute reads instead of repeated Decimal.__float__ calls
+    best_bid_f: Optional[float] = field(init=False, repr=False, default=None)
+    best_ask_f: Optional[float] = field(init=False, repr=False, default=None)
+    spread_f: Optional[float] = field(init=False, repr=False, default=None)
+    mid_f: Optional[float] = field(init=False, repr=False, default=None)
+    # SoA views of the ladders: contiguous float64 price/quantity
+    # columns, so depth and impact math runs as vector ops instead of
+    # walking tuples of Decimals
+    bid_px_f: np.ndarray = field(init=False, repr=False)
+    bid_qty_f: np.ndarray = field(init=False, repr=False)
+    ask_px_f: np.ndarray = field(init=False, repr=False)
+    ask_qty_f: np.ndarray = field(init=False, repr=False)
+    # Memoized Decimal top-of-book values backing the properties below;
+    # the ladders never change after creation
+    _best_bid: Optional[Decimal] = field(init=False, repr=False, default=None)
+    _best_ask: Optional[Decimal] = field(init=False, repr=False, default=None)
+    _spread: Optional[Decimal] = field(init=False, repr=False, default=None)
+    _mid_price: Optional[Decimal] = field(init=False, repr=False, default=None)
+
+    def __post_init__(self):
+        """Cache float scalar and SoA column views of the ladders"""
+        n_bids = len(self.bids)
+        n_asks = len(self.asks)
+        self.bid_px_f = np.fromiter((p for p, _ in self.bids), np.float64, n_bids)
+        self.bid_qty_f = np.fromiter((q for _, q in self.bids), np.float64, n_bids)
+        self.ask_px_f = np.fromiter((p for p, _ in self.asks), np.float64, n_asks)
+        self.ask_qty_f = np.fromiter((q for _, q in self.asks), np.float64, n_asks)
+
+        if n_bids:
+            self._best_bid = self.bids[0][0]
+            self.best_bid_f = float(self.bid_px_f[0])
+        if n_asks:
+            self._best_ask = self.asks[0][0]
+            self.best_ask_f = float(self.ask_px_f[0])
+        if n_bids and n_asks:
+            self._spread = self._best_ask - self._best_bid
+            self._mid_price = (self._best_ask + self._best_bid) / 2
+            self.spread_f = self.best_ask_f - self.best_bid_f
+            self.mid_f = (self.best_ask_f + self.best_bid_f) / 2
+
     @property
     def spread(self) -> Optional[Decimal]:
-        """Calculate bid-ask spread"""
-        if not self.bids or not self.asks:
-            return None
-        return self.asks[0][0] - self.bids[0][0]
-    
+        """Bid-ask spread (computed once at creation)"""
+        return self._spread
+
     @property
     def mid_price(self) -> Optional[Decimal]:
-        """Calculate mid price"""
-        if not self.bids or not self.asks:
-            return None
-        return (self.asks[0][0] + self.bids[0][0]) / 2
-    
+        """Mid price (computed once at creation)"""
+        return self._mid_price
+
     @property
     def best_bid(self) -> Optional[Decimal]:
-        """Get best bid price"""
-        return self.bids[0][0] if self.bids else None
-    
+        """Best bid price (computed once at creation)"""
+        return self._best_bid
+
     @property
     def best_ask(self) -> Optional[Decimal]:
-        """Get best ask price"""
-        return self.asks[0][0] if self.asks else None
+        """Best ask price (computed once at creation)"""
+        return self._best_ask
@@ -1,42 +1,138 @@
 """
 Limit Order Book implementation with FIFO price-time priority matching.
 """
-from collections import defaultdict, deque
+from collections import deque
 from decimal import Decimal
-from typing import Optional, Dict, Deque, List
-import heapq
+from typing import Deque, Optional, Dict, List
 import time
 
-from .order import Order, OrderSide, OrderStatus, OrderType, TimeInForce, Trade, OrderBookSnapshot
+import numpy as np
+from sortedcontainers import SortedDict
+
+from .order import (
+    Order, OrderSide, OrderStatus, OrderType, TimeInForce, Trade,
+    OrderBookSnapshot, from_ticks, to_ticks,
+)
+
+
+class TradesTable:
+    """
+    Columnar (SoA) record of executed trades.
+
+    Mirrors the book's trade record as float64 price/quantity columns,
+    an int64 timestamp column and a boolean aggressor-side column, grown
+    with a doubling policy. Volume and VWAP reductions read these arrays
+    directly instead of re-Pythonizing Trade objects per scan, and the
+    table — not a list of boxed Trades — is the unbounded history.
+    """
+
+    __slots__ = ('px', 'qty', 'ts', 'is_buy', '_size')
+
+    def __init__(self, capacity: int = 1024):
+        self.px = np.empty(capacity)
+        self.qty = np.empty(capacity)
+        self.ts = np.empty(capacity, dtype=np.int64)
+        self.is_buy = np.empty(capacity, dtype=np.bool_)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _grow(self) -> None:
+        new_capacity = max(1024, len(self.px) * 2)
+        self.px = np.resize(self.px, new_capacity)
+        self.qty = np.resize(self.qty, new_capacity)
+        self.ts = np.resize(self.ts, new_capacity)
+        self.is_buy = np.resize(self.is_buy, new_capacity)
+
+    def append_trade(self, trade: Trade) -> None:
+        """Append one trade's columns (reads the cached float views)"""
+        if self._size == len(self.px):
+            self._grow()
+
+        i = self._size
+        self.px[i] = trade.price_f
+        self.qty[i] = trade.qty_f
+        self.ts[i] = trade.timestamp
+        self.is_buy[i] = trade.aggressor_side is OrderSide.BUY
+        self._size = i + 1
+
+    def columns(self):
+        """Filled (px, qty, is_buy) column views"""
+        n = self._size
+        return self.px[:n], self.qty[:n], self.is_buy[:n]
 
 
 class PriceLevel:
     """
     Represents a single price level in the order book.
-    Maintains FIFO queue of orders at this price.
+    Maintains a FIFO queue of orders at this price as an intrusive
+    doubly-linked list: each resting Order carries prev/next/level
+    links, so removing an arbitrary order (cancellation) is an O(1)
+    unlink rather than a linear queue scan.
+
+    price keeps the Decimal as submitted (used verbatim in trades and
+    snapshots); price_t and total_quantity are int ticks, the engine's
+    working representation.
     """
-    def __init__(self, price: Decimal):
+
+    __slots__ = ('price', 'price_t', 'head', 'tail', 'count', 'total_quantity')
+
+    def __init__(self, price: Decimal, price_t: int):
         self.price = price
-        self.orders: Deque[Order] = deque()
-        self.total_quantity = Decimal(0)
-    
+        self.price_t = price_t
+        self.head: Optional[Order] = None
+        self.tail: Optional[Order] = None
+        self.count = 0
+        self.total_quantity = 0  # int ticks
+
     def add_order(self, order: Order) -> None:
-        """Add order to the back of the FIFO queue"""
-        self.orders.append(order)
-        self.total_quantity += order.remaining_quantity
-    
+        """Append order at the tail of the FIFO list"""
+        order.level = self
+        order.prev = self.tail
+        order.next = None
+        if self.tail is None:
+            self.head = order
+        else:
+            self.tail.next = order
+        self.tail = order
+        self.count += 1
+        self.total_quantity += order.remaining_t
+
     def remove_order(self, order: Order) -> bool:
-        """Remove specific order from the level"""
-        try:
-            self.orders.remove(order)
-            self.total_quantity -= order.remaining_quantity
-            return True
-        except ValueError:
+        """Unlink a specific order from the level in O(1)"""
+        if order.level is not self:
             return False
-    
+
+        prev_order = order.prev
+        next_order = order.next
+        if prev_order is None:
+            self.head = next_order
+        else:
+            prev_order.next = next_order
+        if next_order is None:
+            self.tail = prev_order
+        else:
+            next_order.prev = prev_order
+
+        order.prev = order.next = None
+        order.level = None
+        self.count -= 1
+        self.total_quantity -= order.remaining_t
+        return True
+
     def is_empty(self) -> bool:
         """Check if price level has no orders"""
-        return len(self.orders) == 0
+        return self.head is None
+
+    def reset(self, price: Decimal, price_t: int) -> None:
+        """Reinitialize a recycled level for a new price"""
+        self.price = price
+        self.price_t = price_t
+        self.head = None
+        self.tail = None
+        self.count = 0
+        self.total_quantity = 0
 
 
 class LimitOrderBook:
@@ -53,23 +149,43 @@ class LimitOrderBook:
     
     def __init__(self, symbol: str = "DEFAULT"):
         self.symbol = symbol
-        
-        # Price levels: price -> PriceLevel
-        self.bid_levels: Dict[Decimal, PriceLevel] = {}
-        self.ask_levels: Dict[Decimal, PriceLevel] = {}
-        
-        # Sorted price lists (for finding best prices)
-        # We use negative prices for bids to use min-heap as max-heap
-        self.bid_prices: List[Decimal] = []  # Max heap (negated)
-        self.ask_prices: List[Decimal] = []  # Min heap
+
+        # Price levels: SortedDict of int ticks -> PriceLevel per side.
+        # Best price is peekitem at the end (bids) or start (asks),
+        # level insert/delete is O(log P), and cancels remove the level
+        # exactly — no stale best-price entries to skip, unlike the old
+        # heap of pushed-but-never-cleaned prices
+        self.bids: SortedDict = SortedDict()
+        self.asks: SortedDict = SortedDict()
         
         # Order index: order_id -> Order (for O(1) lookups/cancels)
         self.orders: Dict[str, Order] = {}
         
-        # Trade history
-        self.trades: List[Trade] = []
+        # Trade history: the columnar table is the unbounded record
+        # (analytics reductions scan its arrays); boxed Trade objects
+        # are kept only in a bounded ring of the most recent fills for
+        # API/display consumers, so an hour of replay does not pin
+        # millions of objects in RSS
+        self.trades: Deque[Trade] = deque(maxlen=10_000)
+        self.trade_columns = TradesTable()
         self.last_trade_price: Optional[Decimal] = None
         
+        # Monotonic trade sequence; Trade.trade_id is this int, so the
+        # hot loop skips per-fill f-string formatting
+        self._next_trade_seq = 0
+
+        # Book version bumps on every mutation; get_snapshot memoizes
+        # its last result against (version, levels) so idle polling
+        # (strategy ticks, API clients) rebuilds nothing
+        self._version = 0
+        self._snapshot_cache_key = None
+        self._snapshot_cache: Optional[OrderBookSnapshot] = None
+
+        # Free-list of emptied PriceLevel objects; active symbols churn
+        # levels constantly as prices trade through, and recycling them
+        # keeps the hot path off the allocator
+        self._level_pool: List[PriceLevel] = []
+
         # Metrics
         self.total_orders_received = 0
         self.total_trades = 0
@@ -86,34 +202,110 @@ class LimitOrderBook:
             List of trades generated from this order
         """
         self.total_orders_received += 1
+        self._version += 1
         trades = []
-        
+
+        # FOK preflight: walk the opposite side's level totals first and
+        # reject outright if it cannot fully fill at acceptable prices.
+        # The old post-match discard threw the Trade list away but left
+        # the passive fills applied to the book.
+        if order.time_in_force is TimeInForce.FOK and not self._can_fill_fully(order):
+            order.status = OrderStatus.REJECTED
+            return trades
+
+        # One timestamp per aggressor: every fill from this order shares
+        # the same logical time, so don't re-read the clock per trade
+        ts = int(time.time_ns())
+
         if order.is_market():
             # Market orders: match immediately against opposite side
-            trades = self._match_market_order(order)
+            trades = self._match_market_order(order, ts)
+        elif order.is_buy():
+            # Limit orders: match what we can, then add to book; the
+            # matchers are specialized by side so the loop carries no
+            # per-iteration direction branches
+            trades = self._match_limit_buy(order, ts)
         else:
-            # Limit orders: match what we can, then add to book
-            trades = self._match_limit_order(order)
+            trades = self._match_limit_sell(order, ts)
         
         # Handle IOC/FOK time in force
-        if order.time_in_force == TimeInForce.IOC:
-            if order.remaining_quantity > 0:
+        if order.time_in_force is TimeInForce.IOC:
+            if order.remaining_t > 0:
                 order.status = OrderStatus.CANCELLED
-        elif order.time_in_force == TimeInForce.FOK:
-            if trades and sum(t.quantity for t in trades) < order.quantity:
-                # FOK not fully filled - reject (would need to undo trades in production)
-                order.status = OrderStatus.REJECTED
-                trades = []  # Simplified: don't execute partial
-        
-        # Update metrics
-        for trade in trades:
-            self.total_trades += 1
-            self.total_volume += trade.quantity
-            self.last_trade_price = trade.price
-            self.trades.append(trade)
         
+        # Update metrics: one fused pass with hoisted locals and the
+        # scalar write-backs done once after the loop. This stays out
+        # of the matching loops because FOK can discard the batch above.
+        if trades:
+            columns_append = self.trade_columns.append_trade
+            volume = Decimal(0)
+            for trade in trades:
+                volume += trade.quantity
+                columns_append(trade)
+
+            self.total_trades += len(trades)
+            self.total_volume += volume
+            self.last_trade_price = trades[-1].price
+            self.trades.extend(trades)
+
         return trades
     
+    def bulk_load_passive(
+        self,
+        side: OrderSide,
+        prices,
+        quantities,
+        order_ids=None,
+        owner: str = "maker"
+    ) -> List[str]:
+        """
+        Bulk-load resting passive orders on one side without matching.
+
+        Builds the price-level dict and FIFO queues directly in one pass,
+        bypassing the matching path. Intended for open-of-book setup
+        (benchmarks, replay warm-up) where the loaded side cannot cross.
+
+        Args:
+            side: Side to load (BUY or SELL)
+            prices: Sequence of prices (int ticks or Decimal), one per order
+            quantities: Sequence of order quantities
+            order_ids: Optional sequence of order IDs (auto-generated if None)
+            owner: Owner assigned to all loaded orders
+
+        Returns:
+            List of order IDs that were loaded
+        """
+        levels = self.bids if side is OrderSide.BUY else self.asks
+
+        now = int(time.time_ns())
+        loaded_ids = []
+
+        for i, (price, quantity) in enumerate(zip(prices, quantities)):
+            order_id = order_ids[i] if order_ids is not None else f"BL{self.total_orders_received + i}"
+
+            order = Order(
+                order_id=order_id,
+                timestamp=now,
+                side=side,
+                order_type=OrderType.LIMIT,
+                price=price,
+                quantity=quantity,
+                remaining_quantity=quantity,
+                owner=owner
+            )
+
+            level = levels.get(order.price_t)
+            if level is None:
+                level = levels[order.price_t] = self._acquire_level(price, order.price_t)
+            level.add_order(order)
+            self.orders[order_id] = order
+            loaded_ids.append(order_id)
+
+        self.total_orders_received += len(loaded_ids)
+        self._version += 1
+
+        return loaded_ids
+
     def cancel_order(self, order_id: str) -> bool:
         """
         Cancel an order by ID.
@@ -132,15 +324,17 @@ class LimitOrderBook:
             return False
         
         # Remove from book
-        levels = self.bid_levels if order.is_buy() else self.ask_levels
-        level = levels.get(order.price)
-        
+        levels = self.bids if order.is_buy() else self.asks
+        level = levels.get(order.price_t)
+
         if level and level.remove_order(order):
             if level.is_empty():
-                del levels[order.price]
+                del levels[order.price_t]
+                self._release_level(level)
             
             order.status = OrderStatus.CANCELLED
             del self.orders[order_id]
+            self._version += 1
             return True
         
         return False
@@ -160,167 +354,242 @@ class LimitOrderBook:
         if not order or order.status != OrderStatus.NEW:
             return False
         
-        # Update quantity
-        quantity_delta = new_quantity - order.remaining_quantity
+        # Update quantity (Decimal view and tick view together)
+        new_t = to_ticks(new_quantity)
+        quantity_delta_t = new_t - order.remaining_t
         order.quantity = new_quantity
         order.remaining_quantity = new_quantity
-        
+        order.remaining_t = new_t
+
         # Update level total
-        levels = self.bid_levels if order.is_buy() else self.ask_levels
-        level = levels.get(order.price)
+        levels = self.bids if order.is_buy() else self.asks
+        level = levels.get(order.price_t)
         if level:
-            level.total_quantity += quantity_delta
-        
+            level.total_quantity += quantity_delta_t
+
+        self._version += 1
         return True
     
-    def _match_limit_order(self, order: Order) -> List[Trade]:
-        """Match a limit order against the opposite side"""
-        trades = []
-        
-        # Get opposite side
-        opposite_levels = self.ask_levels if order.is_buy() else self.bid_levels
-        opposite_prices = self.ask_prices if order.is_buy() else self.bid_prices
-        
-        while order.remaining_quantity > 0 and opposite_prices:
-            # Get best opposite price
-            if order.is_buy():
-                best_opposite_price = opposite_prices[0]
-                # Check if we can match
-                if best_opposite_price > order.price:
-                    break  # No more matches possible
-            else:
-                # For sells, bid_prices are negated
-                best_opposite_price = -opposite_prices[0]
-                if best_opposite_price < order.price:
+    def _can_fill_fully(self, order: Order) -> bool:
+        """
+        Check whether the opposite side holds enough liquidity at
+        acceptable prices to fill the order completely.
+
+        Sums level totals best-price-first until the order quantity is
+        covered or the price crosses the limit — O(k) in levels walked,
+        with no book mutation. Market orders have no price bound.
+        """
+        needed = order.remaining_t
+        limit_t = order.price_t
+
+        if order.is_buy():
+            for price_t, level in self.asks.items():
+                if limit_t is not None and price_t > limit_t:
                     break
-            
-            # Get the level
-            level = opposite_levels.get(best_opposite_price)
-            if not level or level.is_empty():
-                # Clean up empty level
-                if order.is_buy():
-                    heapq.heappop(opposite_prices)
-                else:
-                    heapq.heappop(opposite_prices)
-                if level:
-                    del opposite_levels[best_opposite_price]
-                continue
-            
+                needed -= level.total_quantity
+                if needed <= 0:
+                    return True
+        else:
+            bids = self.bids
+            for price_t in reversed(bids):
+                if limit_t is not None and price_t < limit_t:
+                    break
+                needed -= bids[price_t].total_quantity
+                if needed <= 0:
+                    return True
+
+        return False
+
+    def _match_limit_buy(self, order: Order, ts: int) -> List[Trade]:
+        """Match a buy limit order against the ask side"""
+        trades = []
+        trades_append = trades.append
+        asks = self.asks
+
+        while order.remaining_t > 0 and asks:
+            # Best ask is the lowest price; levels are deleted as soon
+            # as they empty, so the peeked level is always live
+            best_ask_t, level = asks.peekitem(0)
+            if best_ask_t > order.price_t:
+                break  # No more matches possible
+
             # Match against orders in FIFO order
-            while order.remaining_quantity > 0 and level.orders:
-                passive_order = level.orders[0]
-                
-                # Determine fill quantity
-                fill_qty = min(order.remaining_quantity, passive_order.remaining_quantity)
-                
-                # Create trade
+            while order.remaining_t > 0 and level.head is not None:
+                passive_order = level.head
+
+                # Determine fill quantity: int min for the engine, and
+                # the matching Decimal is already cached on whichever
+                # order is smaller — no new Decimal is constructed
+                if order.remaining_t <= passive_order.remaining_t:
+                    fill_t = order.remaining_t
+                    fill_qty = order.remaining_quantity
+                else:
+                    fill_t = passive_order.remaining_t
+                    fill_qty = passive_order.remaining_quantity
+
+                # Create trade (aggressor is the buy by construction)
+                self._next_trade_seq = (seq := self._next_trade_seq) + 1
                 trade = Trade(
-                    trade_id=f"T{self.total_trades + len(trades)}",
-                    timestamp=int(time.time_ns()),
-                    buy_order_id=order.order_id if order.is_buy() else passive_order.order_id,
-                    sell_order_id=passive_order.order_id if order.is_buy() else order.order_id,
+                    trade_id=seq,
+                    timestamp=ts,
+                    buy_order_id=order.order_id,
+                    sell_order_id=passive_order.order_id,
                     price=passive_order.price,  # Passive order price (price-time priority)
                     quantity=fill_qty,
-                    aggressor_side=order.side
+                    aggressor_side=OrderSide.BUY
                 )
-                trades.append(trade)
-                
+                trades_append(trade)
+
                 # Update orders
-                order.fill(fill_qty)
-                passive_order.fill(fill_qty)
-                level.total_quantity -= fill_qty
-                
+                order.fill_ticks(fill_t)
+                passive_order.fill_ticks(fill_t)
+                level.total_quantity -= fill_t
+
                 # Remove filled passive order
                 if passive_order.is_filled():
-                    level.orders.popleft()
+                    level.remove_order(passive_order)
                     if passive_order.order_id in self.orders:
                         del self.orders[passive_order.order_id]
-            
+
             # Remove empty level
             if level.is_empty():
-                if order.is_buy():
-                    heapq.heappop(opposite_prices)
-                else:
-                    heapq.heappop(opposite_prices)
-                del opposite_levels[best_opposite_price]
-        
+                del asks[best_ask_t]
+                self._release_level(level)
+
         # Add remaining to book if not filled
-        if order.remaining_quantity > 0 and order.time_in_force == TimeInForce.GTC:
+        if order.remaining_t > 0 and order.time_in_force is TimeInForce.GTC:
             self._add_to_book(order)
-        
+
         return trades
-    
-    def _match_market_order(self, order: Order) -> List[Trade]:
+
+    def _match_limit_sell(self, order: Order, ts: int) -> List[Trade]:
+        """Match a sell limit order against the bid side"""
+        trades = []
+        trades_append = trades.append
+        bids = self.bids
+
+        while order.remaining_t > 0 and bids:
+            # Best bid is the highest price
+            best_bid_t, level = bids.peekitem(-1)
+            if best_bid_t < order.price_t:
+                break
+
+            while order.remaining_t > 0 and level.head is not None:
+                passive_order = level.head
+
+                if order.remaining_t <= passive_order.remaining_t:
+                    fill_t = order.remaining_t
+                    fill_qty = order.remaining_quantity
+                else:
+                    fill_t = passive_order.remaining_t
+                    fill_qty = passive_order.remaining_quantity
+
+                self._next_trade_seq = (seq := self._next_trade_seq) + 1
+                trade = Trade(
+                    trade_id=seq,
+                    timestamp=ts,
+                    buy_order_id=passive_order.order_id,
+                    sell_order_id=order.order_id,
+                    price=passive_order.price,
+                    quantity=fill_qty,
+                    aggressor_side=OrderSide.SELL
+                )
+                trades_append(trade)
+
+                order.fill_ticks(fill_t)
+                passive_order.fill_ticks(fill_t)
+                level.total_quantity -= fill_t
+
+                if passive_order.is_filled():
+                    level.remove_order(passive_order)
+                    if passive_order.order_id in self.orders:
+                        del self.orders[passive_order.order_id]
+
+            if level.is_empty():
+                del bids[best_bid_t]
+                self._release_level(level)
+
+        if order.remaining_t > 0 and order.time_in_force is TimeInForce.GTC:
+            self._add_to_book(order)
+
+        return trades
+
+    def _match_market_order(self, order: Order, ts: int) -> List[Trade]:
         """Match a market order (takes liquidity until filled or book empty)"""
         trades = []
-        
-        opposite_levels = self.ask_levels if order.is_buy() else self.bid_levels
-        opposite_prices = self.ask_prices if order.is_buy() else self.bid_prices
-        
-        while order.remaining_quantity > 0 and opposite_prices:
-            best_opposite_price = opposite_prices[0] if order.is_buy() else -opposite_prices[0]
-            
-            level = opposite_levels.get(best_opposite_price)
-            if not level or level.is_empty():
-                if order.is_buy():
-                    heapq.heappop(opposite_prices)
+        trades_append = trades.append
+
+        opposite = self.asks if order.is_buy() else self.bids
+        is_buy = order.is_buy()
+
+        while order.remaining_t > 0 and opposite:
+            best_opposite_t, level = opposite.peekitem(0 if is_buy else -1)
+
+            while order.remaining_t > 0 and level.head is not None:
+                passive_order = level.head
+
+                if order.remaining_t <= passive_order.remaining_t:
+                    fill_t = order.remaining_t
+                    fill_qty = order.remaining_quantity
                 else:
-                    heapq.heappop(opposite_prices)
-                if level:
-                    del opposite_levels[best_opposite_price]
-                continue
-            
-            while order.remaining_quantity > 0 and level.orders:
-                passive_order = level.orders[0]
-                fill_qty = min(order.remaining_quantity, passive_order.remaining_quantity)
-                
+                    fill_t = passive_order.remaining_t
+                    fill_qty = passive_order.remaining_quantity
+
+                self._next_trade_seq = (seq := self._next_trade_seq) + 1
                 trade = Trade(
-                    trade_id=f"T{self.total_trades + len(trades)}",
-                    timestamp=int(time.time_ns()),
-                    buy_order_id=order.order_id if order.is_buy() else passive_order.order_id,
-                    sell_order_id=passive_order.order_id if order.is_buy() else order.order_id,
+                    trade_id=seq,
+                    timestamp=ts,
+                    buy_order_id=order.order_id if is_buy else passive_order.order_id,
+                    sell_order_id=passive_order.order_id if is_buy else order.order_id,
                     price=passive_order.price,
                     quantity=fill_qty,
                     aggressor_side=order.side
                 )
-                trades.append(trade)
-                
-                order.fill(fill_qty)
-                passive_order.fill(fill_qty)
-                level.total_quantity -= fill_qty
-                
+                trades_append(trade)
+
+                order.fill_ticks(fill_t)
+                passive_order.fill_ticks(fill_t)
+                level.total_quantity -= fill_t
+
                 if passive_order.is_filled():
-                    level.orders.popleft()
+                    level.remove_order(passive_order)
                     if passive_order.order_id in self.orders:
                         del self.orders[passive_order.order_id]
-            
+
             if level.is_empty():
-                if order.is_buy():
-                    heapq.heappop(opposite_prices)
-                else:
-                    heapq.heappop(opposite_prices)
-                del opposite_levels[best_opposite_price]
-        
+                del opposite[best_opposite_t]
+                self._release_level(level)
+
         # Market orders don't rest in the book
-        if order.remaining_quantity > 0:
+        if order.remaining_t > 0:
             order.status = OrderStatus.CANCELLED  # Unfilled portion cancelled
         
         return trades
     
+    def _acquire_level(self, price: Decimal, price_t: int) -> PriceLevel:
+        """Take a level from the free-list, or allocate a fresh one"""
+        pool = self._level_pool
+        if pool:
+            level = pool.pop()
+            level.reset(price, price_t)
+            return level
+        return PriceLevel(price, price_t)
+
+    def _release_level(self, level: PriceLevel) -> None:
+        """Return an emptied level to the free-list for reuse"""
+        if len(self._level_pool) < 1024:
+            self._level_pool.append(level)
+
     def _add_to_book(self, order: Order) -> None:
         """Add order to the appropriate side of the book"""
         self.orders[order.order_id] = order
-        
-        if order.is_buy():
-            if order.price not in self.bid_levels:
-                self.bid_levels[order.price] = PriceLevel(order.price)
-                heapq.heappush(self.bid_prices, -order.price)  # Negate for max-heap
-            self.bid_levels[order.price].add_order(order)
-        else:
-            if order.price not in self.ask_levels:
-                self.ask_levels[order.price] = PriceLevel(order.price)
-                heapq.heappush(self.ask_prices, order.price)
-            self.ask_levels[order.price].add_order(order)
+
+        book_side = self.bids if order.is_buy() else self.asks
+        price_t = order.price_t
+        level = book_side.get(price_t)
+        if level is None:
+            level = book_side[price_t] = self._acquire_level(order.price, price_t)
+        level.add_order(order)
     
     def get_snapshot(self, levels: int = 10) -> OrderBookSnapshot:
         """
@@ -332,48 +601,51 @@ class LimitOrderBook:
         Returns:
             OrderBookSnapshot with current state
         """
+        key = (self._version, levels)
+        if key == self._snapshot_cache_key:
+            return self._snapshot_cache
+
         bids = []
         asks = []
-        
-        # Get top bid levels
-        sorted_bids = sorted(self.bid_levels.keys(), reverse=True)[:levels]
-        for price in sorted_bids:
-            level = self.bid_levels[price]
-            bids.append((price, level.total_quantity))
-        
-        # Get top ask levels
-        sorted_asks = sorted(self.ask_levels.keys())[:levels]
-        for price in sorted_asks:
-            level = self.ask_levels[price]
-            asks.append((price, level.total_quantity))
-        
-        return OrderBookSnapshot(
+
+        # Top-of-book slices straight off the sorted structures — no
+        # O(P log P) sort per snapshot; Decimals only at the edge
+        for level in reversed(self.bids.values()[-levels:]):
+            bids.append((level.price, from_ticks(level.total_quantity)))
+
+        for level in self.asks.values()[:levels]:
+            asks.append((level.price, from_ticks(level.total_quantity)))
+
+        snapshot = OrderBookSnapshot(
             timestamp=int(time.time_ns()),
             bids=bids,
             asks=asks,
             last_trade_price=self.last_trade_price
         )
+        self._snapshot_cache_key = key
+        self._snapshot_cache = snapshot
+        return snapshot
     
     @property
     def best_bid(self) -> Optional[Decimal]:
         """Get best bid price"""
-        return -self.bid_prices[0] if self.bid_prices else None
-    
+        return self.bids.peekitem(-1)[1].price if self.bids else None
+
     @property
     def best_ask(self) -> Optional[Decimal]:
         """Get best ask price"""
-        return self.ask_prices[0] if self.ask_prices else None
+        return self.asks.peekitem(0)[1].price if self.asks else None
     
     @property
     def spread(self) -> Optional[Decimal]:
         """Get current bid-ask spread"""
-        if self.best_bid is not None and self.best_ask is not None:
-            return self.best_ask - self.best_bid
+        if self.bids and self.asks:
+            return self.asks.peekitem(0)[1].price - self.bids.peekitem(-1)[1].price
         return None
-    
+
     @property
     def mid_price(self) -> Optional[Decimal]:
         """Get current mid price"""
-        if self.best_bid is not None and self.best_ask is not None:
-            return (self.best_bid + self.best_ask) / 2
+        if self.bids and self.asks:
+            return (self.asks.peekitem(0)[1].price + self.bids.peekitem(-1)[1].price) / 2
         return None
@@ -2,6 +2,7 @@
 Market data replay engine for historical order book reconstruction.
 """
 import asyncio
+import inspect
 from typing import List, Optional, Callable
 from decimal import Decimal
 import time
@@ -33,10 +34,12 @@ class ReplayEngine:
         self.speed_multiplier = speed_multiplier
         self.is_playing = False
         
-        # Callbacks for events
-        self.on_order_callbacks: List[Callable] = []
-        self.on_trade_callbacks: List[Callable] = []
-        self.on_snapshot_callbacks: List[Callable] = []
+        # Callbacks for events, stored as (callback, is_coroutine)
+        # pairs; the coroutine check runs once at registration so the
+        # dispatch loop awaits only callbacks that need it
+        self.on_order_callbacks: List[tuple] = []
+        self.on_trade_callbacks: List[tuple] = []
+        self.on_snapshot_callbacks: List[tuple] = []
     
     def register_callback(self, event_type: str, callback: Callable) -> None:
         """
@@ -44,14 +47,19 @@ class ReplayEngine:
         
         Args:
             event_type: "order", "trade", or "snapshot"
-            callback: Callable to invoke on event
+            callback: Callable to invoke on event; plain functions and
+                coroutine functions are both accepted. Snapshot
+                callbacks receive (snapshot, sim_time) where sim_time
+                is seconds of simulated time since the start of the
+                stream.
         """
+        entry = (callback, inspect.iscoroutinefunction(callback))
         if event_type == "order":
-            self.on_order_callbacks.append(callback)
+            self.on_order_callbacks.append(entry)
         elif event_type == "trade":
-            self.on_trade_callbacks.append(callback)
+            self.on_trade_callbacks.append(entry)
         elif event_type == "snapshot":
-            self.on_snapshot_callbacks.append(callback)
+            self.on_snapshot_callbacks.append(entry)
     
     async def replay_synthetic(
         self,
@@ -75,23 +83,44 @@ class ReplayEngine:
         
         self.is_playing = True
         start_time = time.time()
-        last_snapshot = 0
-        
+        stream_start_ns: Optional[int] = None
+        last_snapshot = 0.0
+
+        # Pacing runs at ~1ms simulated resolution: events inside the
+        # same bucket share a single wall-clock read and at most one
+        # sleep, instead of a time.time() + asyncio.sleep(0) round trip
+        # per event. Tick-by-tick mode (speed 0) never touches either.
+        pacing = self.speed_multiplier > 0
+        inv_speed = 1.0 / self.speed_multiplier if pacing else 0.0
+        pace_resolution = 0.001
+        next_pace = 0.0
+
         orders_processed = 0
         cancels_processed = 0
-        
+
         for event in generator.generate_order_stream(duration_seconds):
             if not self.is_playing:
                 break
-            
+
+            # Simulated clock from event timestamps; drives snapshot
+            # cadence and callbacks, so tick-by-tick replay is
+            # deterministic and avoids a wall-clock read per event
+            if stream_start_ns is None:
+                stream_start_ns = event["timestamp"]
+            sim_time = (event["timestamp"] - stream_start_ns) / 1e9
+
             # Simulate timing if not tick-by-tick
-            if self.speed_multiplier > 0:
-                event_time = (event["timestamp"] - int(start_time * 1e9)) / 1e9
-                current_time = time.time() - start_time
-                wait_time = (event_time - current_time) / self.speed_multiplier
-                
-                if wait_time > 0:
+            if pacing and sim_time >= next_pace:
+                # Target wall clock is sim_time scaled by the speed
+                # multiplier; sleep only for the remaining backlog
+                wait_time = sim_time * inv_speed - (time.time() - start_time)
+
+                # Sub-millisecond waits accumulate into the next
+                # bucket rather than paying OS timer granularity on a
+                # sleep that cannot be honored that finely anyway
+                if wait_time > pace_resolution:
                     await asyncio.sleep(wait_time)
+                next_pace = sim_time + pace_resolution
             
             # Process event
             if event["type"] == "new":
@@ -101,24 +130,32 @@ class ReplayEngine:
                 orders_processed += 1
                 
                 # Trigger callbacks
-                for callback in self.on_order_callbacks:
-                    await callback(order, trades)
+                for callback, is_coro in self.on_order_callbacks:
+                    if is_coro:
+                        await callback(order, trades)
+                    else:
+                        callback(order, trades)
                 
                 for trade in trades:
-                    for callback in self.on_trade_callbacks:
-                        await callback(trade)
+                    for callback, is_coro in self.on_trade_callbacks:
+                        if is_coro:
+                            await callback(trade)
+                        else:
+                            callback(trade)
             
             elif event["type"] == "cancel":
                 self.order_book.cancel_order(event["order_id"])
                 cancels_processed += 1
             
-            # Periodic snapshots
-            current_time = time.time() - start_time
-            if current_time - last_snapshot >= snapshot_interval:
+            # Periodic snapshots, keyed on the simulated clock
+            if sim_time - last_snapshot >= snapshot_interval:
                 snapshot = self.order_book.get_snapshot()
-                for callback in self.on_snapshot_callbacks:
-                    await callback(snapshot)
-                last_snapshot = current_time
+                for callback, is_coro in self.on_snapshot_callbacks:
+                    if is_coro:
+                        await callback(snapshot, sim_time)
+                    else:
+                        callback(snapshot, sim_time)
+                last_snapshot = sim_time
         
         # Final statistics
         return {
@@ -2,21 +2,26 @@
 Synthetic order flow generator for testing and simulation.
 Uses stochastic processes to generate realistic order arrival patterns.
 """
-import random
 import time
 from decimal import Decimal
-from typing import List, Generator
+from typing import Generator, List, Optional
 import math
 
-from ..engine.order import Order, OrderSide, OrderType, TimeInForce
+import numpy as np
+
+from ..engine.order import Order, OrderSide, OrderType, TimeInForce, PRICE_SCALE
 
 
 class PoissonOrderGenerator:
     """
     Generates synthetic orders using Poisson arrival process.
     Creates realistic order flow for testing matching engine.
+
+    All random draws are pre-sampled in batches through a
+    numpy.random.Generator — one vectorized call per distribution per
+    chunk instead of a Python-level RNG call per event.
     """
-    
+
     def __init__(
         self,
         symbol: str = "TEST",
@@ -24,11 +29,12 @@ class PoissonOrderGenerator:
         volatility: float = 0.02,
         arrival_rate: float = 10.0,  # Orders per second
         market_order_prob: float = 0.3,
-        cancel_prob: float = 0.2
+        cancel_prob: float = 0.2,
+        seed: Optional[int] = None
     ):
         """
         Initialize synthetic order generator.
-        
+
         Args:
             symbol: Trading symbol
             base_price: Initial mid price
@@ -36,6 +42,7 @@ class PoissonOrderGenerator:
             arrival_rate: Average orders per second (lambda)
             market_order_prob: Probability of market order vs limit
             cancel_prob: Probability of cancelling existing order
+            seed: Optional RNG seed for reproducible streams
         """
         self.symbol = symbol
         self.base_price = base_price
@@ -43,109 +50,112 @@ class PoissonOrderGenerator:
         self.arrival_rate = arrival_rate
         self.market_order_prob = market_order_prob
         self.cancel_prob = cancel_prob
-        
+
         self.order_counter = 0
         self.active_orders: List[str] = []
-        
+
         # Price evolution (simple random walk)
         self.current_mid = base_price
-    
+
+        self._rng = np.random.default_rng(seed)
+
     def generate_order_stream(self, duration_seconds: float) -> Generator[dict, None, None]:
         """
         Generate stream of order events over time.
-        
+
         Args:
             duration_seconds: Simulation duration
-        
+
         Yields:
             Order event dicts with keys: type (new/cancel), order (if new)
         """
+        rng = self._rng
         start_time = time.time_ns()
-        elapsed = 0
-        
-        while elapsed < duration_seconds:
-            # Wait for next event (exponential distribution)
-            wait_time = random.expovariate(self.arrival_rate)
-            elapsed += wait_time
-            
-            if elapsed >= duration_seconds:
-                break
-            
-            # Decide event type
-            if self.active_orders and random.random() < self.cancel_prob:
-                # Cancel event
-                order_id = random.choice(self.active_orders)
-                self.active_orders.remove(order_id)
-                yield {
-                    "type": "cancel",
-                    "order_id": order_id,
-                    "timestamp": start_time + int(elapsed * 1e9)
-                }
-            else:
-                # New order event
-                order = self._generate_order(start_time + int(elapsed * 1e9))
-                
-                if order.order_type == OrderType.LIMIT:
-                    self.active_orders.append(order.order_id)
-                
-                yield {
-                    "type": "new",
-                    "order": order,
-                    "timestamp": order.timestamp
-                }
-            
-            # Evolve price (random walk)
-            self._evolve_price()
-    
-    def _generate_order(self, timestamp: int) -> Order:
-        """Generate a single synthetic order"""
-        self.order_counter += 1
-        order_id = f"O{self.order_counter}"
-        
-        # Determine order type
-        is_market = random.random() < self.market_order_prob
-        order_type = OrderType.MARKET if is_market else OrderType.LIMIT
-        
-        # Determine side (50/50)
-        side = OrderSide.BUY if random.random() < 0.5 else OrderSide.SELL
-        
-        # Generate quantity (log-normal distribution)
-        quantity = Decimal(str(int(random.lognormvariate(3, 1))))
-        quantity = max(quantity, Decimal("1"))
-        
-        # Generate price for limit orders
-        if order_type == OrderType.LIMIT:
-            # Place around current mid with some spread
-            tick_size = self.base_price * Decimal("0.0001")  # 1 bps
-            spread_ticks = int(random.expovariate(1.0 / 5))  # Avg 5 ticks from mid
-            
-            if side == OrderSide.BUY:
-                # Bid: below mid
-                price = self.current_mid - (spread_ticks * tick_size)
-            else:
-                # Ask: above mid
-                price = self.current_mid + (spread_ticks * tick_size)
-            
-            price = max(price, tick_size)  # Ensure positive
-        else:
-            price = None
-        
-        return Order(
-            order_id=order_id,
-            timestamp=timestamp,
-            side=side,
-            order_type=order_type,
-            price=price,
-            quantity=quantity,
-            remaining_quantity=quantity,
-            owner=f"trader{random.randint(1, 10)}",
-            time_in_force=TimeInForce.GTC
-        )
-    
-    def _evolve_price(self) -> None:
-        """Update current mid price (random walk)"""
-        # Simple Brownian motion
-        dt = 1.0 / self.arrival_rate
-        shock = random.gauss(0, self.volatility * math.sqrt(dt))
-        self.current_mid *= Decimal(str(1 + shock))
-        self.current_mid = max(self.current_mid, Decimal("1.0"))
+        elapsed = 0.0
+
+        # The mid-price walk runs in float; Decimal prices are built
+        # only for the limit orders that actually carry one
+        mid = float(self.current_mid)
+        tick_f = float(self.base_price) * 1e-4  # 1 bps
+        shock_scale = self.volatility * math.sqrt(1.0 / self.arrival_rate)
+        chunk = max(int(self.arrival_rate * duration_seconds * 1.2), 256)
+
+        active = self.active_orders
+        done = False
+
+        while not done:
+            # One vectorized draw per distribution for the whole chunk
+            waits = rng.exponential(1.0 / self.arrival_rate, chunk)
+            cancel_draws = rng.random(chunk)
+            pick_draws = rng.random(chunk)
+            market_draws = rng.random(chunk)
+            side_draws = rng.random(chunk)
+            quantities = np.maximum(np.exp(rng.normal(3.0, 1.0, chunk)).astype(np.int64), 1)
+            spread_ticks = rng.exponential(5.0, chunk).astype(np.int64)
+            owner_ids = rng.integers(1, 11, chunk)
+            shocks = rng.normal(0.0, shock_scale, chunk)
+
+            for i in range(chunk):
+                elapsed += waits[i]
+                if elapsed >= duration_seconds:
+                    done = True
+                    break
+
+                timestamp = start_time + int(elapsed * 1e9)
+
+                if active and cancel_draws[i] < self.cancel_prob:
+                    # Cancel event: uniform pick, swap-pop removal
+                    j = int(pick_draws[i] * len(active))
+                    order_id = active[j]
+                    active[j] = active[-1]
+                    active.pop()
+                    yield {
+                        "type": "cancel",
+                        "order_id": order_id,
+                        "timestamp": timestamp
+                    }
+                else:
+                    # New order event
+                    self.order_counter += 1
+                    side = OrderSide.BUY if side_draws[i] < 0.5 else OrderSide.SELL
+
+                    if market_draws[i] < self.market_order_prob:
+                        order_type = OrderType.MARKET
+                        price_t = None
+                    else:
+                        order_type = OrderType.LIMIT
+                        # Place around current mid with some spread,
+                        # rounded in tick space; Decimal(str(...))
+                        # would format and reparse a string per order
+                        if side is OrderSide.BUY:
+                            px = mid - spread_ticks[i] * tick_f
+                        else:
+                            px = mid + spread_ticks[i] * tick_f
+                        price_t = round(max(px, tick_f) * PRICE_SCALE)
+
+                    # Generated values are valid by construction, so
+                    # take the non-validating tick constructor
+                    order = Order.from_tick_values(
+                        order_id=f"O{self.order_counter}",
+                        timestamp=timestamp,
+                        side=side,
+                        order_type=order_type,
+                        price_t=price_t,
+                        qty_t=int(quantities[i]) * PRICE_SCALE,
+                        owner=f"trader{owner_ids[i]}",
+                        time_in_force=TimeInForce.GTC
+                    )
+
+                    if order_type is OrderType.LIMIT:
+                        active.append(order.order_id)
+
+                    yield {
+                        "type": "new",
+                        "order": order,
+                        "timestamp": timestamp
+                    }
+
+                # Evolve price (random walk)
+                mid = max(mid * (1.0 + shocks[i]), 1.0)
+
+        self.current_mid = Decimal(str(round(mid, 4)))
@@ -2,10 +2,12 @@
 Base class for execution strategies.
 """
 from abc import ABC, abstractmethod
+from collections import deque
 from decimal import Decimal
-from typing import List, Optional
+from typing import Deque, List, Optional
+import time
 
-from ..engine.order import Order, OrderSide
+from ..engine.order import Order, OrderSide, OrderType, TimeInForce, Trade
 from ..engine.order_book import LimitOrderBook, OrderBookSnapshot
 
 
@@ -16,12 +18,23 @@ class ExecutionStrategy(ABC):
     Strategies decide how to execute a parent order over time,
     breaking it into child orders to minimize cost/impact.
     """
-    
+
+    # Backtests spin up many strategy instances and generate_orders
+    # touches a dozen attributes per tick; slotted storage keeps those
+    # lookups off a per-instance __dict__. Subclasses must declare
+    # their own slots too.
+    __slots__ = (
+        'target_quantity', 'side', 'symbol',
+        'executed_quantity', 'child_orders', 'child_order_count',
+        'total_child_quantity', 'total_cost', '_side_sign'
+    )
+
     def __init__(
         self,
         target_quantity: Decimal,
         side: OrderSide,
-        symbol: str = "DEFAULT"
+        symbol: str = "DEFAULT",
+        child_order_history: int = 10_000
     ):
         """
         Initialize strategy.
@@ -30,20 +43,32 @@ class ExecutionStrategy(ABC):
             target_quantity: Total quantity to execute
             side: BUY or SELL
             symbol: Trading symbol
+            child_order_history: Number of recent child orders to keep
         """
         self.target_quantity = target_quantity
         self.side = side
         self.symbol = symbol
         
         self.executed_quantity = Decimal(0)
-        self.child_orders: List[Order] = []
+        # Recent children only; long runs would otherwise pin every
+        # child order in memory. Aggregates come from the running
+        # counters below, not from this ring.
+        self.child_orders: Deque[Order] = deque(maxlen=child_order_history)
+        self.child_order_count = 0
+        self.total_child_quantity = Decimal(0)
         self.total_cost = Decimal(0)
+
+        # Side direction resolved once for the shared aggression-price
+        # helper: buys anchor at the bid and walk up the spread, sells
+        # anchor at the ask and walk down
+        self._side_sign = 1.0 if side is OrderSide.BUY else -1.0
     
     @abstractmethod
     def generate_orders(
         self,
         snapshot: OrderBookSnapshot,
-        elapsed_time: float
+        elapsed_time: float,
+        timestamp_ns: Optional[int] = None
     ) -> List[Order]:
         """
         Generate child orders based on current market state.
@@ -51,12 +76,96 @@ class ExecutionStrategy(ABC):
         Args:
             snapshot: Current order book snapshot
             elapsed_time: Time elapsed since strategy start
+            timestamp_ns: Tick timestamp for child orders; when None
+                the strategy reads the wall clock per order
         
         Returns:
             List of orders to submit
         """
         pass
     
+    def _aggression_price(
+        self,
+        snapshot: OrderBookSnapshot,
+        aggression: float
+    ) -> Optional[Decimal]:
+        """
+        Limit price `aggression` of the way across the spread from this
+        side's anchor (best bid for buys, best ask for sells).
+
+        Works in float off the snapshot's cached views; the sign makes
+        the formula uniform for both sides. Falls back to the mid price
+        when one side of the book is missing (None when there is no mid).
+
+        Args:
+            snapshot: Current order book snapshot
+            aggression: 0 = join the anchor, 1 = cross to the far side
+
+        Returns:
+            Limit price as Decimal, or None with no usable market
+        """
+        bid_f = snapshot.best_bid_f
+        ask_f = snapshot.best_ask_f
+        if bid_f is None or ask_f is None:
+            return snapshot.mid_price
+
+        sign = self._side_sign
+        anchor = bid_f if sign > 0 else ask_f
+        return Decimal(str(round(anchor + sign * (ask_f - bid_f) * aggression, 4)))
+
+    def _record_child(self, order: Order) -> None:
+        """Track a new child order in the ring and running aggregates"""
+        self.child_orders.append(order)
+        self.child_order_count += 1
+        self.total_child_quantity += order.quantity
+
+    def _build_aggressive_order(
+        self,
+        snapshot: OrderBookSnapshot,
+        order_id: str,
+        quantity: Decimal,
+        owner: str,
+        aggression: float,
+        fallback_price: Decimal,
+        timestamp_ns: Optional[int] = None
+    ) -> Order:
+        """
+        Shared construction path for aggression-priced IOC children:
+        a market order when very aggressive, otherwise a limit priced
+        across the spread by _aggression_price (falling back to
+        fallback_price with no usable market).
+        """
+        if aggression > 0.8:
+            order_type = OrderType.MARKET
+            price = None
+        else:
+            order_type = OrderType.LIMIT
+            price = self._aggression_price(snapshot, aggression)
+            if price is None:
+                price = fallback_price
+
+        return Order(
+            order_id=order_id,
+            timestamp=timestamp_ns if timestamp_ns is not None else int(time.time_ns()),
+            side=self.side,
+            order_type=order_type,
+            price=price,
+            quantity=quantity,
+            remaining_quantity=quantity,
+            owner=owner,
+            time_in_force=TimeInForce.IOC
+        )
+
+    def next_wakeup_time(self) -> float:
+        """
+        Earliest elapsed time at which this strategy can produce work.
+
+        Drivers may skip generate_orders calls before this time.
+        Schedule-based strategies override it; the default of 0.0 means
+        poll every tick.
+        """
+        return 0.0
+
     def update_execution(self, order: Order, fill_price: Decimal, fill_quantity: Decimal) -> None:
         """
         Update strategy state after a fill.
@@ -68,7 +177,28 @@ class ExecutionStrategy(ABC):
         """
         self.executed_quantity += fill_quantity
         self.total_cost += fill_price * fill_quantity
-    
+
+    def update_execution_batch(self, trades: List[Trade]) -> None:
+        """
+        Update strategy state for all fills from one order submission.
+
+        Accumulates quantity and notional across the batch before
+        touching the running totals, so a submission that fills against
+        N levels costs two updates to strategy state instead of 2N.
+
+        Args:
+            trades: Trades returned by a single add_order call
+        """
+        filled = Decimal(0)
+        cost = Decimal(0)
+        for trade in trades:
+            quantity = trade.quantity
+            filled += quantity
+            cost += trade.price * quantity
+
+        self.executed_quantity += filled
+        self.total_cost += cost
+
     @property
     def is_complete(self) -> bool:
         """Check if strategy has executed target quantity"""
@@ -6,7 +6,7 @@ from typing import List, Optional
 import time
 
 from .base_strategy import ExecutionStrategy
-from ..engine.order import Order, OrderType, TimeInForce
+from ..engine.order import Order, OrderSide, OrderType, TimeInForce
 from ..engine.order_book import OrderBookSnapshot
 
 
@@ -17,7 +17,13 @@ class PostingStrategy(ExecutionStrategy):
     Places limit orders inside the spread to capture rebates
     and minimize market impact. Reprices as market moves.
     """
-    
+
+    __slots__ = (
+        'spread_fraction', 'max_order_size', 'reprice_threshold',
+        'active_order', 'last_post_price', '_last_post_price_f',
+        'order_counter', '_id_prefix'
+    )
+
     def __init__(
         self,
         target_quantity: Decimal,
@@ -46,12 +52,19 @@ class PostingStrategy(ExecutionStrategy):
         
         self.active_order: Optional[Order] = None
         self.last_post_price: Optional[Decimal] = None
+        # Float mirror of last_post_price; the reprice check runs every
+        # tick and compares against the float mid, so keep it cast-free
+        self._last_post_price_f: Optional[float] = None
         self.order_counter = 0
+        # Symbol is immutable; formatting the id prefix once leaves a
+        # plain concat per child order
+        self._id_prefix = f"POST_{symbol}_"
     
     def generate_orders(
         self,
         snapshot: OrderBookSnapshot,
-        elapsed_time: float
+        elapsed_time: float,
+        timestamp_ns: int = None
     ) -> List[Order]:
         """Generate passive limit orders at advantageous prices"""
         if self.is_complete:
@@ -59,9 +72,10 @@ class PostingStrategy(ExecutionStrategy):
         
         # Check if we need to reprice existing order
         should_reprice = False
-        if self.active_order and self.last_post_price:
-            if snapshot.mid_price:
-                price_move = abs(float(snapshot.mid_price - self.last_post_price) / float(self.last_post_price))
+        if self.active_order and self._last_post_price_f:
+            if snapshot.mid_f is not None:
+                last_f = self._last_post_price_f
+                price_move = abs((snapshot.mid_f - last_f) / last_f)
                 if price_move > self.reprice_threshold:
                     should_reprice = True
         
@@ -69,18 +83,21 @@ class PostingStrategy(ExecutionStrategy):
         if self.active_order and not should_reprice:
             return []
         
-        # Calculate target price
-        if not snapshot.best_bid or not snapshot.best_ask:
+        # Calculate target price in float off the snapshot's cached
+        # views; a Decimal is built once at the Order boundary
+        bid_f = snapshot.best_bid_f
+        ask_f = snapshot.best_ask_f
+        if bid_f is None or ask_f is None:
             return []  # Can't post without market
-        
-        spread = snapshot.best_ask - snapshot.best_bid
-        
-        if self.side.value == "BUY":
+
+        spread_f = ask_f - bid_f
+
+        if self.side is OrderSide.BUY:
             # Post bid inside spread
-            target_price = snapshot.best_bid + (spread * Decimal(str(self.spread_fraction)))
+            target_price = Decimal(str(round(bid_f + spread_f * self.spread_fraction, 4)))
         else:
             # Post offer inside spread
-            target_price = snapshot.best_ask - (spread * Decimal(str(self.spread_fraction)))
+            target_price = Decimal(str(round(ask_f - spread_f * self.spread_fraction, 4)))
         
         # Determine order size
         remaining = self.remaining_quantity
@@ -92,8 +109,8 @@ class PostingStrategy(ExecutionStrategy):
         # Create limit order
         self.order_counter += 1
         order = Order(
-            order_id=f"POST_{self.symbol}_{self.order_counter}",
-            timestamp=int(time.time_ns()),
+            order_id=self._id_prefix + str(self.order_counter),
+            timestamp=timestamp_ns if timestamp_ns is not None else int(time.time_ns()),
             side=self.side,
             order_type=OrderType.LIMIT,
             price=target_price,
@@ -105,6 +122,7 @@ class PostingStrategy(ExecutionStrategy):
         
         self.active_order = order
         self.last_post_price = target_price
-        self.child_orders.append(order)
+        self._last_post_price_f = float(target_price)
+        self._record_child(order)
         
         return [order]
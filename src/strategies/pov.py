@@ -10,6 +10,12 @@ from ..engine.order import Order, OrderType, TimeInForce, OrderSide
 from ..engine.order_book import OrderBookSnapshot
 
 
+# Decimal parsing is not free; shared thresholds and fallbacks are
+# built once at import instead of per generate_orders call
+_DEC_100 = Decimal("100")
+_MIN_ORDER_SIZE = Decimal("0.01")
+
+
 class POVStrategy(ExecutionStrategy):
     """
     POV (Percentage of Volume) execution strategy.
@@ -18,6 +24,12 @@ class POVStrategy(ExecutionStrategy):
     Trades X% of the market's traded volume over the execution period.
     """
 
+    __slots__ = (
+        'target_participation', 'duration', 'aggression', 'check_interval',
+        '_participation_d', 'start_time', 'last_check_time',
+        'last_market_volume', 'order_counter', '_id_prefix'
+    )
+
     def __init__(
         self,
         target_quantity: Decimal,
@@ -47,17 +59,32 @@ class POVStrategy(ExecutionStrategy):
         self.aggression = aggression
         self.check_interval = check_interval
 
+        # Participation is immutable after construction; parse it to
+        # Decimal once instead of Decimal(str(...)) per slice
+        self._participation_d = Decimal(str(target_participation))
+
         self.start_time: float = None
         self.last_check_time = 0
         self.last_market_volume = Decimal(0)
 
         self.order_counter = 0
+        # Symbol is immutable; formatting the id prefix once leaves a
+        # plain concat per child order
+        self._id_prefix = f"POV_{symbol}_"
+
+    def next_wakeup_time(self) -> float:
+        """Elapsed time at which the next volume check can fire"""
+        if self.start_time is None:
+            # First poll anchors the strategy clock; never skip it
+            return 0.0
+        return self.start_time + self.last_check_time + self.check_interval
 
     def generate_orders(
         self,
         snapshot: OrderBookSnapshot,
         elapsed_time: float,
-        current_market_volume: Decimal = None
+        current_market_volume: Decimal = None,
+        timestamp_ns: int = None
     ) -> List[Order]:
         """
         Generate POV orders to maintain target participation rate.
@@ -82,13 +109,11 @@ class POVStrategy(ExecutionStrategy):
 
         # Estimate market volume if not provided
         if current_market_volume is None:
-            # Estimate from bid/ask depth (simplified)
-            market_vol_estimate = Decimal(0)
-            if snapshot.bids:
-                market_vol_estimate += sum(qty for _, qty in snapshot.bids[:5])
-            if snapshot.asks:
-                market_vol_estimate += sum(qty for _, qty in snapshot.asks[:5])
-            current_market_volume = market_vol_estimate
+            # Estimate from bid/ask depth (simplified): one C-level sum
+            # over the snapshot's float columns instead of a Python
+            # generator doing Decimal adds per level
+            depth_f = snapshot.bid_qty_f[:5].sum() + snapshot.ask_qty_f[:5].sum()
+            current_market_volume = Decimal(str(float(depth_f)))
 
         # Calculate volume increment since last check
         volume_delta = current_market_volume - self.last_market_volume
@@ -98,57 +123,32 @@ class POVStrategy(ExecutionStrategy):
             self.last_check_time = relative_time
             return []
 
+        # Fast float pre-check: most ticks see a delta too small to
+        # clear the minimum order size, so skip the Decimal multiply
+        if float(volume_delta) * self.target_participation < 0.01:
+            self.last_check_time = relative_time
+            return []
+
         # Target: execute target_participation of the volume delta
-        target_slice = volume_delta * Decimal(str(self.target_participation))
+        target_slice = volume_delta * self._participation_d
 
         # Cap by remaining quantity
         slice_qty = min(target_slice, self.remaining_quantity)
 
-        if slice_qty < Decimal("0.01"):  # Minimum order size
+        if slice_qty < _MIN_ORDER_SIZE:
             self.last_check_time = relative_time
             return []
 
         self.order_counter += 1
-        order_id = f"POV_{self.symbol}_{self.order_counter}"
-
-        # Determine order parameters based on aggression
-        if self.aggression > 0.8:
-            # Very aggressive: market order
-            order_type = OrderType.MARKET
-            price = None
-        else:
-            # Limit order: price depends on aggression
-            order_type = OrderType.LIMIT
-
-            if self.side == OrderSide.BUY:
-                # For buys, more aggressive = higher price (closer to ask)
-                if snapshot.best_ask and snapshot.best_bid:
-                    spread = snapshot.best_ask - snapshot.best_bid
-                    price = snapshot.best_bid + (spread * Decimal(str(self.aggression)))
-                else:
-                    price = snapshot.mid_price if snapshot.mid_price else Decimal("100")
-            else:
-                # For sells, more aggressive = lower price (closer to bid)
-                if snapshot.best_ask and snapshot.best_bid:
-                    spread = snapshot.best_ask - snapshot.best_bid
-                    price = snapshot.best_ask - (spread * Decimal(str(self.aggression)))
-                else:
-                    price = snapshot.mid_price if snapshot.mid_price else Decimal("100")
-
-        # Create order
-        order = Order(
-            order_id=order_id,
-            timestamp=int(time.time_ns()),
-            side=self.side,
-            order_type=order_type,
-            price=price,
-            quantity=slice_qty,
-            remaining_quantity=slice_qty,
-            owner="POV_STRATEGY",
-            time_in_force=TimeInForce.IOC
+        order_id = self._id_prefix + str(self.order_counter)
+
+        # Create order through the shared aggression path
+        order = self._build_aggressive_order(
+            snapshot, order_id, slice_qty, "POV_STRATEGY",
+            self.aggression, _DEC_100, timestamp_ns
         )
 
-        self.child_orders.append(order)
+        self._record_child(order)
         self.last_check_time = relative_time
 
         return [order]
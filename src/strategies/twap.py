@@ -6,10 +6,15 @@ from typing import List
 import time
 
 from .base_strategy import ExecutionStrategy
-from ..engine.order import Order, OrderType, TimeInForce
+from ..engine.order import Order, OrderSide, OrderType, TimeInForce
 from ..engine.order_book import OrderBookSnapshot
 
 
+# Decimal parsing is not free; shared thresholds and fallbacks are
+# built once at import instead of per generate_orders call
+_DEC_100 = Decimal("100")
+
+
 class TWAPStrategy(ExecutionStrategy):
     """
     TWAP (Time-Weighted Average Price) execution strategy.
@@ -17,7 +22,13 @@ class TWAPStrategy(ExecutionStrategy):
     Splits parent order into equal-sized child orders
     executed at regular time intervals.
     """
-    
+
+    __slots__ = (
+        'duration', 'num_slices', 'slice_interval', 'slice_quantity',
+        'aggression', '_slice_times', 'start_time', 'slices_executed',
+        'order_counter', '_id_prefix'
+    )
+
     def __init__(
         self,
         target_quantity: Decimal,
@@ -46,25 +57,33 @@ class TWAPStrategy(ExecutionStrategy):
         self.slice_quantity = target_quantity / Decimal(num_slices)
         self.aggression = aggression
         
+        # Slice times are fully determined here; the per-tick check is
+        # a single list index and float compare against the schedule
+        self._slice_times = [i * self.slice_interval for i in range(num_slices)]
+
         self.start_time: float = None
-        self.next_slice_time = 0
         self.slices_executed = 0
         
         self.order_counter = 0
+        # Symbol is immutable; formatting the id prefix once leaves a
+        # plain concat per child order
+        self._id_prefix = f"TWAP_{symbol}_"
     
     def generate_orders(
         self,
         snapshot: OrderBookSnapshot,
-        elapsed_time: float
+        elapsed_time: float,
+        timestamp_ns: int = None
     ) -> List[Order]:
         """Generate TWAP slice orders at scheduled intervals"""
         if self.start_time is None:
             self.start_time = elapsed_time
         
         relative_time = elapsed_time - self.start_time
-        
-        # Check if it's time for next slice
-        if relative_time < self.next_slice_time or self.slices_executed >= self.num_slices:
+
+        # Fast no-op path: most ticks land between slices and exit here
+        idx = self.slices_executed
+        if idx >= self.num_slices or relative_time < self._slice_times[idx]:
             return []
         
         if self.is_complete:
@@ -72,50 +91,23 @@ class TWAPStrategy(ExecutionStrategy):
         
         # Generate slice order
         self.order_counter += 1
-        order_id = f"TWAP_{self.symbol}_{self.order_counter}"
-        
-        # Determine order parameters based on aggression
-        if self.aggression > 0.8:
-            # Very aggressive: market order
-            order_type = OrderType.MARKET
-            price = None
-        else:
-            # Limit order: price depends on aggression
-            order_type = OrderType.LIMIT
-            
-            if self.side.value == "BUY":
-                # For buys, more aggressive = higher price (closer to ask)
-                if snapshot.best_ask and snapshot.best_bid:
-                    spread = snapshot.best_ask - snapshot.best_bid
-                    price = snapshot.best_bid + (spread * Decimal(str(self.aggression)))
-                else:
-                    price = snapshot.mid_price if snapshot.mid_price else Decimal("100")
-            else:
-                # For sells, more aggressive = lower price (closer to bid)
-                if snapshot.best_ask and snapshot.best_bid:
-                    spread = snapshot.best_ask - snapshot.best_bid
-                    price = snapshot.best_ask - (spread * Decimal(str(self.aggression)))
-                else:
-                    price = snapshot.mid_price if snapshot.mid_price else Decimal("100")
-        
-        # Create slice order
-        remaining = self.remaining_quantity
-        slice_qty = min(self.slice_quantity, remaining)
+        order_id = self._id_prefix + str(self.order_counter)
         
-        order = Order(
-            order_id=order_id,
-            timestamp=int(time.time_ns()),
-            side=self.side,
-            order_type=order_type,
-            price=price,
-            quantity=slice_qty,
-            remaining_quantity=slice_qty,
-            owner="TWAP_STRATEGY",
-            time_in_force=TimeInForce.IOC  # Use IOC for TWAP slices
+        # Create slice order through the shared aggression path
+        slice_qty = min(self.slice_quantity, self.remaining_quantity)
+        order = self._build_aggressive_order(
+            snapshot, order_id, slice_qty, "TWAP_STRATEGY",
+            self.aggression, _DEC_100, timestamp_ns
         )
         
-        self.child_orders.append(order)
+        self._record_child(order)
         self.slices_executed += 1
-        self.next_slice_time += self.slice_interval
-        
+
         return [order]
+
+    def next_wakeup_time(self) -> float:
+        """Elapsed time at which the next slice can fire"""
+        if self.slices_executed >= self.num_slices:
+            return float("inf")
+        start = self.start_time if self.start_time is not None else 0.0
+        return start + self._slice_times[self.slices_executed]
@@ -5,11 +5,51 @@ from decimal import Decimal
 from typing import List, Dict
 import time
 
+import numpy as np
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
 from .base_strategy import ExecutionStrategy
 from ..engine.order import Order, OrderType, TimeInForce, OrderSide
 from ..engine.order_book import OrderBookSnapshot
 
 
+# Decimal parsing is not free; shared thresholds and fallbacks are
+# built once at import instead of per generate_orders call
+_DEC_100 = Decimal("100")
+_MIN_ORDER_SIZE = Decimal("0.01")
+
+
+if _HAVE_NUMBA:
+    @njit(cache=True)
+    def _vwap_cum_fraction(prof_t, prof_vol, prof_cum, time_pct):
+        """
+        Cumulative volume fraction at time_pct on the knot schedule.
+
+        Linear scan for the knot interval — profiles have ~10 knots, so
+        a compiled scan beats binary-search call overhead.
+        """
+        j = -1
+        for i in range(prof_t.shape[0]):
+            if prof_t[i] <= time_pct:
+                j = i
+            else:
+                break
+        if j < 0:
+            return 0.0
+
+        cum = prof_cum[j]
+        if j < prof_t.shape[0] - 1:
+            t1 = prof_t[j]
+            interval_pct = (time_pct - t1) / (prof_t[j + 1] - t1)
+            cum += prof_vol[j] * interval_pct
+        return cum
+
+
 class VWAPStrategy(ExecutionStrategy):
     """
     VWAP (Volume-Weighted Average Price) execution strategy.
@@ -18,6 +58,13 @@ class VWAPStrategy(ExecutionStrategy):
     executing more during high-volume periods.
     """
 
+    __slots__ = (
+        'duration', 'aggression', 'volume_profile',
+        '_prof_t', '_prof_vol', '_prof_cum', '_cum_qty_at_knot',
+        'start_time', 'last_slice_time', 'slice_interval',
+        'order_counter', '_id_prefix', 'cumulative_volume_executed'
+    )
+
     def __init__(
         self,
         target_quantity: Decimal,
@@ -50,11 +97,33 @@ class VWAPStrategy(ExecutionStrategy):
         else:
             self.volume_profile = volume_profile
 
+        # The profile never changes after construction, so sort it once
+        # into knot-time / knot-volume / cumulative arrays; the per-call
+        # lookup is a searchsorted plus one interpolation term instead
+        # of a sorted() and a Python walk over the dict
+        knots = sorted(self.volume_profile)
+        self._prof_t = np.array(knots)
+        self._prof_vol = np.array([self.volume_profile[t] for t in knots])
+        self._prof_cum = np.concatenate(([0.0], np.cumsum(self._prof_vol[:-1])))
+
+        # Knot-aligned cumulative quantities resolved to Decimal once;
+        # a lookup that lands exactly on a knot reuses these instead of
+        # paying a str-parse plus Decimal multiply. Interpolated points
+        # keep the float-sum-then-multiply path because splitting the
+        # sum into Decimal terms rounds differently
+        self._cum_qty_at_knot = {
+            t: self.target_quantity * Decimal(str(float(c)))
+            for t, c in zip(knots, self._prof_cum)
+        }
+
         self.start_time: float = None
         self.last_slice_time = 0
         self.slice_interval = 5.0  # Check every 5 seconds
 
         self.order_counter = 0
+        # Symbol is immutable; formatting the id prefix once leaves a
+        # plain concat per child order
+        self._id_prefix = f"VWAP_{symbol}_"
         self.cumulative_volume_executed = Decimal(0)
 
     def _create_default_profile(self) -> Dict[float, float]:
@@ -87,28 +156,43 @@ class VWAPStrategy(ExecutionStrategy):
         Returns:
             Target cumulative quantity at this time
         """
-        # Interpolate volume profile
-        cumulative_vol_pct = 0.0
-
-        sorted_times = sorted(self.volume_profile.keys())
-        for i in range(len(sorted_times) - 1):
-            t1, t2 = sorted_times[i], sorted_times[i + 1]
-
-            if time_pct >= t2:
-                # Fully past this interval
-                cumulative_vol_pct += self.volume_profile[t1]
-            elif time_pct >= t1:
-                # Partially through this interval
-                interval_pct = (time_pct - t1) / (t2 - t1)
-                cumulative_vol_pct += self.volume_profile[t1] * interval_pct
-                break
-
-        return self.target_quantity * Decimal(str(cumulative_vol_pct))
+        knot_qty = self._cum_qty_at_knot.get(time_pct)
+        if knot_qty is not None:
+            return knot_qty
+
+        if _HAVE_NUMBA:
+            cumulative_vol_pct = _vwap_cum_fraction(
+                self._prof_t, self._prof_vol, self._prof_cum, time_pct
+            )
+            return self.target_quantity * Decimal(str(float(cumulative_vol_pct)))
+
+        # Fallback: search the precomputed schedule for the cumulative
+        # volume at the last knot passed, plus the partial interval
+        prof_t = self._prof_t
+        j = int(np.searchsorted(prof_t, time_pct, side='right')) - 1
+        if j < 0:
+            return self.target_quantity * Decimal(0)
+
+        cumulative_vol_pct = self._prof_cum[j]
+        if j < len(prof_t) - 1:
+            t1 = prof_t[j]
+            interval_pct = (time_pct - t1) / (prof_t[j + 1] - t1)
+            cumulative_vol_pct += self._prof_vol[j] * interval_pct
+
+        return self.target_quantity * Decimal(str(float(cumulative_vol_pct)))
+
+    def next_wakeup_time(self) -> float:
+        """Elapsed time at which the next slice check can fire"""
+        if self.start_time is None:
+            # First poll anchors the strategy clock; never skip it
+            return 0.0
+        return self.start_time + self.last_slice_time + self.slice_interval
 
     def generate_orders(
         self,
         snapshot: OrderBookSnapshot,
-        elapsed_time: float
+        elapsed_time: float,
+        timestamp_ns: int = None
     ) -> List[Order]:
         """Generate VWAP-scheduled orders based on volume profile"""
         if self.start_time is None:
@@ -130,57 +214,33 @@ class VWAPStrategy(ExecutionStrategy):
         # Determine how much we should have executed by now
         shortfall = target_cumulative - self.executed_quantity
 
-        if shortfall <= 0:
+        # Float pre-checks cover the common silent ticks (on track, or
+        # a shortfall below the minimum order size) without further
+        # Decimal comparisons
+        shortfall_f = float(shortfall)
+        if shortfall_f <= 0.0:
             self.last_slice_time = relative_time
             return []  # On track or ahead
 
+        if shortfall_f < 0.01:
+            return []
+
         # Generate slice order for shortfall
         slice_qty = min(shortfall, self.remaining_quantity)
 
-        if slice_qty < Decimal("0.01"):  # Minimum order size
+        if slice_qty < _MIN_ORDER_SIZE:
             return []
 
         self.order_counter += 1
-        order_id = f"VWAP_{self.symbol}_{self.order_counter}"
+        order_id = self._id_prefix + str(self.order_counter)
 
-        # Determine order parameters based on aggression
-        if self.aggression > 0.8:
-            # Very aggressive: market order
-            order_type = OrderType.MARKET
-            price = None
-        else:
-            # Limit order: price depends on aggression
-            order_type = OrderType.LIMIT
-
-            if self.side == OrderSide.BUY:
-                # For buys, more aggressive = higher price (closer to ask)
-                if snapshot.best_ask and snapshot.best_bid:
-                    spread = snapshot.best_ask - snapshot.best_bid
-                    price = snapshot.best_bid + (spread * Decimal(str(self.aggression)))
-                else:
-                    price = snapshot.mid_price if snapshot.mid_price else Decimal("100")
-            else:
-                # For sells, more aggressive = lower price (closer to bid)
-                if snapshot.best_ask and snapshot.best_bid:
-                    spread = snapshot.best_ask - snapshot.best_bid
-                    price = snapshot.best_ask - (spread * Decimal(str(self.aggression)))
-                else:
-                    price = snapshot.mid_price if snapshot.mid_price else Decimal("100")
-
-        # Create order
-        order = Order(
-            order_id=order_id,
-            timestamp=int(time.time_ns()),
-            side=self.side,
-            order_type=order_type,
-            price=price,
-            quantity=slice_qty,
-            remaining_quantity=slice_qty,
-            owner="VWAP_STRATEGY",
-            time_in_force=TimeInForce.IOC
+        # Create order through the shared aggression path
+        order = self._build_aggressive_order(
+            snapshot, order_id, slice_qty, "VWAP_STRATEGY",
+            self.aggression, _DEC_100, timestamp_ns
         )
 
-        self.child_orders.append(order)
+        self._record_child(order)
         self.last_slice_time = relative_time
 
         return [order]